@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Measure service cold start: time until the task modules are imported (the web server can accept
+/delta and health checks) and time until the location model is loaded (/ready returns 200).
+Run inside container: docker exec geocoding-service uv run python -m benchmarks.cold_start [runs]
+
+Every run uses a fresh interpreter. Run it on an older checkout to compare before/after.
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+PROBE = r"""
+import json, sys, time
+start = time.perf_counter()
+from src.task import GeoExtractionTask
+imported = time.perf_counter() - start
+heavy = sorted(m for m in ("spacy", "torch", "transformers", "flair") if m in sys.modules)
+analyzer = GeoExtractionTask.ner_analyzer
+if hasattr(analyzer, "ensure_loaded"):
+    analyzer.ensure_loaded()
+ready = time.perf_counter() - start
+print(json.dumps({"imported": imported, "ready": ready, "heavy": heavy}))
+"""
+
+runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+print("=" * 80)
+print("COLD START BENCHMARK")
+print("=" * 80)
+results = []
+for i in range(runs):
+    out = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True, check=True)
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    results.append(result)
+    print(f"   run {i + 1}: import {result['imported']:6.2f}s   models loaded {result['ready']:6.2f}s   "
+          f"ML libraries imported with src.task: {result['heavy'] or 'none'}")
+
+print(f"\n   median time to accept requests: {statistics.median(r['imported'] for r in results):.2f}s")
+print(f"   median time to ready:           {statistics.median(r['ready'] for r in results):.2f}s")
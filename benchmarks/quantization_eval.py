@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Compare fp32 and dynamic INT8 inference per model: weight size, latency and agreement on a fixed evaluation set.
+Run inside container: docker exec geocoding-service uv run python -m benchmarks.quantization_eval [geo] [flair] [title]
+
+The fp32 predictions are the reference; agreement is the entity-level F1 of the INT8 predictions against them
+(exact span and label), or the share of identical titles. Evaluation texts are read from benchmarks/eval_set.jsonl
+(override with QUANT_EVAL_SET).
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from src.ner_extractors import SpacyGeoAnalyzer, FlairExtractor, TitleExtractor
+from src.ner_models import model_manager, estimate_model_bytes
+from src.quantization import quantization_enabled, quantize_model
+
+EVAL_SET = os.getenv("QUANT_EVAL_SET", str(Path(__file__).with_name("eval_set.jsonl")))
+with open(EVAL_SET, encoding="utf-8") as f:
+    EXAMPLES = [json.loads(line) for line in f if line.strip()]
+
+
+def entity_f1(reference, predicted):
+    ref = {(i, *e) for i, ents in enumerate(reference) for e in ents}
+    pred = {(i, *e) for i, ents in enumerate(predicted) for e in ents}
+    if not ref and not pred:
+        return 1.0
+    tp = len(ref & pred)
+    return 2 * tp / (len(ref) + len(pred))
+
+
+def geo_case():
+    analyzer = SpacyGeoAnalyzer(model_path=os.getenv("NER_MODEL_PATH"))
+    texts = [e["text"] for e in EXAMPLES if e["language"] == "dutch"]
+
+    def predict(text):
+        return [(e.start_char, e.end_char, e.label_) for e in analyzer.extract_entities(text).ents]
+    return analyzer.nlp, texts, predict, entity_f1
+
+
+def flair_case(model_name="flair/ner-german-legal", language="german"):
+    extractor = FlairExtractor(language, model_name)
+    texts = [e["text"] for e in EXAMPLES if e["language"] == language]
+
+    def predict(text):
+        return [(e["start"], e["end"], e["label"]) for e in extractor.extract(text)]
+    return model_manager.get_flair_model(model_name), texts, predict, entity_f1
+
+
+def title_case():
+    extractor = TitleExtractor("dutch")
+    texts = [e["text"] for e in EXAMPLES]
+
+    def predict(text):
+        return [e["text"] for e in extractor.extract(text)]
+
+    def same_title(reference, predicted):
+        return sum(r == p for r, p in zip(reference, predicted)) / len(reference)
+    return model_manager.get_title_extraction_model(), texts, predict, same_title
+
+
+def refresh_title_prefix_cache():
+    """Recompute the prompt prefix cache with the quantized model (it holds fp32 keys/values otherwise)."""
+    generator = model_manager.get_title_extraction_model()
+    if getattr(generator, "prefix_cache", None) is not None:
+        from src.title_generation import PromptPrefixCache
+        generator.prefix_cache = PromptPrefixCache(generator.model, generator.tokenizer)
+
+
+def run(predict, texts):
+    predict(texts[0])  # warm-up
+    start = time.perf_counter()
+    predictions = [predict(text) for text in texts]
+    return predictions, (time.perf_counter() - start) / len(texts) * 1000
+
+
+CASES = {"geo": geo_case, "flair": flair_case, "title": title_case}
+# State derived from the fp32 weights that must be rebuilt after quantizing
+AFTER_QUANTIZE = {"title": refresh_title_prefix_cache}
+
+print("=" * 80)
+print("INT8 DYNAMIC QUANTIZATION EVALUATION")
+print(f"Evaluation set: {EVAL_SET} ({len(EXAMPLES)} texts)")
+print("=" * 80)
+for name in sys.argv[1:] or CASES:
+    print(f"\n[{name}]")
+    if quantization_enabled(name):
+        # The fp32 baseline must not be quantized at load time
+        print(f"   skipped: unset NER_QUANTIZE ({name} models would be loaded quantized)")
+        continue
+    try:
+        model, texts, predict, agreement = CASES[name]()
+    except Exception as e:
+        print(f"   skipped: {e}")
+        continue
+
+    fp32_size = estimate_model_bytes(model)
+    fp32_predictions, fp32_ms = run(predict, texts)
+    layers = quantize_model(model)
+    if name in AFTER_QUANTIZE:
+        AFTER_QUANTIZE[name]()
+    int8_size = estimate_model_bytes(model)
+    int8_predictions, int8_ms = run(predict, texts)
+
+    print(f"   fp32: {fp32_size / 1024 / 1024:8.1f} MB   {fp32_ms:8.1f} ms/doc")
+    print(f"   int8: {int8_size / 1024 / 1024:8.1f} MB   {int8_ms:8.1f} ms/doc   ({layers} Linear layers quantized)")
+    size_ratio = f"{int8_size / fp32_size:.0%}" if fp32_size else "n/a"
+    print(f"   speed-up {fp32_ms / int8_ms:.2f}x, size {size_ratio} of fp32, "
+          f"agreement with fp32 {agreement(fp32_predictions, int8_predictions):.3f}")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Compare spaCy pipeline profiles (full vs NER-only): load time, memory and per-doc latency.
+Run inside container: docker exec geocoding-service uv run python -m benchmarks.spacy_profiles [model ...]
+
+Without arguments the location model (NER_MODEL_PATH) and the general spaCy models are measured.
+"""
+
+import gc
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.ner_config import NER_MODELS, SPACY_PROFILES
+from src.ner_models import load_spacy_pipeline
+
+TEXTS = [
+    "De Korenmarkt 15 in Gent is een belangrijk adres.",
+    "Mathias De Clercq is burgemeester sinds 15 oktober 2024.",
+    "Het college keurt de heraanleg van de Sint-Pietersnieuwstraat tussen de Overpoortstraat en het "
+    "Sint-Pietersplein goed, inclusief de aansluiting op de Kortrijksesteenweg in Sint-Martens-Latem.",
+    "Die Stadt Berlin hat am 2. April 2025 den Bebauungsplan für die Friedrichstraße beschlossen.",
+] * 25
+
+
+def rss_mb():
+    """Current resident set size in MB (Linux)."""
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * resource.getpagesize() / 1024 / 1024
+
+
+def measure(model, profile):
+    """Runs in a fresh process, so each profile starts from the same state."""
+    import spacy  # noqa: F401  (library import time is not part of the pipeline load)
+    try:
+        import spacy_transformers  # noqa: F401
+    except ImportError:
+        pass
+    gc.collect()
+    rss_before = rss_mb()
+    start = time.perf_counter()
+    nlp = load_spacy_pipeline(model, profile)
+    load_s = time.perf_counter() - start
+    rss_delta = rss_mb() - rss_before
+
+    list(nlp.pipe(TEXTS[:4]))  # warm-up
+    start = time.perf_counter()
+    docs = list(nlp.pipe(TEXTS))
+    per_doc_ms = (time.perf_counter() - start) / len(TEXTS) * 1000
+    ents = [[(e.start_char, e.end_char, e.label_) for e in doc.ents] for doc in docs]
+    components = list(nlp.pipe_names)
+    del nlp, docs
+    return load_s, rss_delta, per_doc_ms, ents, components
+
+
+def main():
+    models = sys.argv[1:] or [m for m in [os.getenv("NER_MODEL_PATH"), *NER_MODELS['spacy'].values()] if m]
+
+    print("=" * 80)
+    print("SPACY PROFILE BENCHMARK")
+    print("=" * 80)
+    for model in models:
+        print(f"\n{model}")
+        results = {}
+        for profile in SPACY_PROFILES:
+            try:
+                with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                    results[profile] = executor.submit(measure, model, profile).result()
+            except Exception as e:
+                print(f"   {profile:5} failed: {e}")
+                continue
+            load_s, rss_delta, per_doc_ms, _, components = results[profile]
+            print(f"   {profile:5} load {load_s:6.2f}s   memory +{rss_delta:7.1f} MB   {per_doc_ms:6.2f} ms/doc   {components}")
+
+        if len(results) == len(SPACY_PROFILES):
+            full, ner = results['full'], results['ner']
+            print(f"   saved: load {full[0] - ner[0]:.2f}s, memory {full[1] - ner[1]:.1f} MB, "
+                  f"{full[2] - ner[2]:.2f} ms/doc ({(1 - ner[2] / full[2]) * 100:.0f}%)")
+            print(f"   entities identical: {full[3] == ner[3]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Measure title prompt prefill time (time to the first generated token) with and without the instruction prefix cache.
+Run inside container: docker exec geocoding-service uv run python -m benchmarks.title_prefill [runs]
+
+Uses the texts of benchmarks/eval_set.jsonl.
+"""
+
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import torch
+
+from src.ner_models import model_manager
+from src.title_generation import prompt_ids
+
+runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+with open(Path(__file__).with_name("eval_set.jsonl"), encoding="utf-8") as f:
+    TEXTS = [json.loads(line)["text"] for line in f if line.strip()]
+
+generator = model_manager.get_title_extraction_model()
+model, tokenizer = generator.model, generator.tokenizer
+prefix_cache = getattr(generator, "prefix_cache", None)
+if prefix_cache is None or prefix_cache.cache is None:
+    sys.exit("Prefix cache not available (TITLE_PREFIX_CACHE=false or unsupported cache type)")
+
+
+def prefill_ms(input_ids, cached):
+    kwargs = {"past_key_values": prefix_cache.copy()} if cached else {}
+    start = time.perf_counter()
+    with torch.no_grad():
+        model.generate(input_ids, attention_mask=torch.ones_like(input_ids), max_new_tokens=1, **kwargs)
+    return (time.perf_counter() - start) * 1000
+
+
+print("=" * 80)
+print("TITLE PREFILL BENCHMARK")
+print(f"Prefix: {prefix_cache.length} tokens, {len(TEXTS)} documents, {runs} runs")
+print("=" * 80)
+inputs = [prompt_ids(tokenizer, text) for text in TEXTS]
+prefill_ms(inputs[0], False)  # warm-up
+results = {}
+for cached in (False, True):
+    times = [prefill_ms(ids, cached) for _ in range(runs) for ids in inputs]
+    results[cached] = statistics.median(times)
+    print(f"   {'with' if cached else 'without':7} prefix cache: median {results[cached]:7.1f} ms/document")
+
+tokens = statistics.mean(int(ids.shape[1]) for ids in inputs)
+print(f"\n   mean prompt {tokens:.0f} tokens, of which {prefix_cache.length} cached; "
+      f"prefill {results[False] / results[True]:.2f}x faster")
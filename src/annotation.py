@@ -1,4 +1,3 @@
-import logging
 from typing import Optional, Iterator, Any
 from abc import ABC, abstractmethod
 from string import Template
@@ -7,6 +6,7 @@ import uuid
 from helpers import query
 from escape_helpers import sparql_escape_uri, sparql_escape_string, sparql_escape_float, sparql_escape_int
 from .sparql_config import get_prefixes_for_query, GRAPHS, AGENT_TYPES
+from .geometry import to_wkt
 
 
 class Annotation(ABC):
@@ -286,8 +286,9 @@ class GeoAnnotation(NERAnnotation):
     
     def __init__(self, geojson: dict, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        logging.fatal(geojson)
-        self.geometry = ", ".join(f"{x} {y}" for x, y in geojson.get("coordinates", []))
+        self.geometry = to_wkt(geojson)
+        if self.geometry is None:
+            raise ValueError(f"Cannot convert geometry to WKT: {geojson}")
 
     def get_extra_inserts(self) -> str:
         return Template(
@@ -300,7 +301,7 @@ class GeoAnnotation(NERAnnotation):
             """
         ).substitute(
             body=sparql_escape_uri(self.class_uri),
-            wkt=sparql_escape_string(f"SRID=31370;POINT({self.geometry})^^geosparql:wktLiteral"),
+            wkt=sparql_escape_string(f"SRID=31370;{self.geometry}^^geosparql:wktLiteral"),
             geom=sparql_escape_uri(f"http://data.lblod.info/id/geometries/{uuid.uuid4()}")
         )
 
@@ -0,0 +1,211 @@
+"""
+Asynchronous Nominatim Geocoder
+
+asyncio counterpart of `NominatimGeocoder`. All requests run on one dedicated
+event loop thread owned by the geocoder, so background tasks running in
+FastAPI's threadpool share a single HTTP connection pool, a single
+concurrency limit and a single token bucket. Identical lookups issued at the
+same time by different tasks are coalesced into one request.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Dict, List, Optional, TypeVar
+
+import httpx
+
+from .geocode_cache import GeocodeCache, cache_key
+from .gazetteer import StreetGazetteer
+from .geometry import GEOMETRY_MODES, apply_geometry_mode
+from .nominatim_geocoder import NominatimGeocoder
+from .rate_limiter import TokenBucket
+from .single_flight import AsyncSingleFlight
+from .circuit_breaker import CLOSED, BackendUnavailableError, CircuitBreaker, CircuitOpenError
+
+T = TypeVar("T")
+
+
+class AsyncNominatimGeocoder:
+    """
+    Geocoder client for Nominatim using asyncio and a shared token bucket.
+
+    `search` is a coroutine with the same arguments and result format as
+    `NominatimGeocoder.search`. Synchronous callers (e.g. tasks running in a
+    threadpool) use `run()` to execute coroutines on the geocoder's loop.
+    """
+
+    # Reuse the request parameters and result format of the blocking client
+    _params = NominatimGeocoder._params
+    _format = NominatimGeocoder._format
+
+    def __init__(self, base_url: str = "http://localhost:8080", requests_per_second: float = 2.0,
+                 max_concurrency: int = 4, timeout: float = 10.0, cache: Optional[GeocodeCache] = None,
+                 gazetteer: Optional[StreetGazetteer] = None, breaker: Optional[CircuitBreaker] = None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache = cache
+        self.gazetteer = gazetteer
+        self.breaker = breaker or CircuitBreaker(max_concurrency=self.max_concurrency)
+        self.bucket = TokenBucket(requests_per_second)
+        self._flights = AsyncSingleFlight()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._slots: Optional[asyncio.Condition] = None
+        self._in_flight = 0
+
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def available(self) -> bool:
+        """False while the circuit breaker is open and requests fail fast."""
+        return not self.breaker.is_open
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the circuit breaker admits requests again."""
+        return self.breaker.retry_after
+
+    @property
+    def recovering(self) -> bool:
+        """True while the circuit breaker is not closed; it then admits a single probe request at a time."""
+        return self.breaker.state != CLOSED
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the geocoder's event loop thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="nominatim-geocoder", daemon=True).start()
+                self._loop = loop
+        return self._loop
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """Run a coroutine on the geocoder's event loop and wait for its result."""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def search_sync(self, query: str, city: str = "Gent", limit: int = 1, country: str = "BE",
+                    geometry: str = "full", tolerance: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Blocking wrapper around `search` for synchronous callers."""
+        return self.run(self.search(query, city=city, limit=limit, country=country,
+                                    geometry=geometry, tolerance=tolerance))
+
+    async def search(self, query: str, city: str = "Gent", limit: int = 1, country: str = "BE",
+                     geometry: str = "full", tolerance: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Search for a location and return geocoded result with coordinates.
+
+        `geometry` controls the returned `geojson`: "full" (Nominatim's
+        geometry), "simplified" (simplified by Nominatim with `tolerance` in
+        degrees), "centroid" (a Point) or "none".
+        """
+        if not query or not query.strip():
+            return None
+        if geometry not in GEOMETRY_MODES:
+            raise ValueError(f"Unsupported geometry mode: {geometry}")
+
+        if self.gazetteer is not None:
+            result = self.gazetteer.search(query, city=city)
+            if result is not None:
+                return apply_geometry_mode(result, geometry, tolerance)
+
+        key = cache_key(query, city, country, limit, geometry, tolerance)
+        if self.cache is not None:
+            found, cached = self.cache.lookup(key)
+            if found:
+                return {**cached, "query": query} if cached is not None else None
+
+        result = await self._flights.do(key, lambda: self._lookup(key, query, city, limit, country, geometry, tolerance))
+        if result is not None and result["query"] != query:
+            result = {**result, "query": query}
+        return result
+
+    async def _lookup(self, key: str, query: str, city: str, limit: int, country: str,
+                      geometry: str, tolerance: Optional[float]) -> Optional[Dict[str, Any]]:
+        """Fetch and format a result from Nominatim and store it in the cache."""
+        # An unavailable backend is not "no result": CircuitOpenError and transient
+        # failures are raised so the caller can retry the whole document later
+        try:
+            results = await self._fetch(query, city, limit, country, geometry, tolerance)
+        except CircuitOpenError:
+            raise
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code >= 500:
+                raise BackendUnavailableError(f"Nominatim request failed for {query!r}: {exc}",
+                                              max(self.retry_after, self.breaker.reset_timeout)) from exc
+            self.logger.warning(
+                "Nominatim request failed for %r: %s", query, exc)
+            return None
+        except httpx.TransportError as exc:
+            raise BackendUnavailableError(f"Nominatim request failed for {query!r}: {exc}",
+                                          max(self.retry_after, self.breaker.reset_timeout)) from exc
+        except httpx.HTTPError as exc:
+            self.logger.warning(
+                "Nominatim request failed for %r: %s", query, exc)
+            return None
+        except ValueError as exc:
+            self.logger.warning(
+                "Failed parsing Nominatim JSON for %r: %s", query, exc)
+            return None
+
+        if not results:
+            if self.cache is not None:
+                self.cache.set_negative(key)
+            return None
+
+        result = apply_geometry_mode(
+            self._format(results[0], original_query=query), geometry, tolerance, simplify_locally=False)
+        if self.cache is not None:
+            self.cache.set(key, result)
+        return result
+
+    async def _fetch(self, query: str, city: str, limit: int, country: str,
+                     geometry: str = "full", tolerance: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Query the Nominatim API within the concurrency limit, rate budget and circuit breaker."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_concurrency,
+                                    max_keepalive_connections=self.max_concurrency))
+            self._slots = asyncio.Condition()
+
+        self.breaker.before_call()
+        async with self._slots:
+            # The breaker lowers the limit when latency rises and raises it again when it recovers
+            await self._slots.wait_for(lambda: self._in_flight < self.breaker.concurrency_limit)
+            self._in_flight += 1
+        try:
+            await self.bucket.acquire_async()
+            start = time.monotonic()
+            try:
+                resp = await self._client.get("/search", params=self._params(query, city, limit, country, geometry, tolerance))
+                resp.raise_for_status()
+                results = resp.json()
+            except httpx.HTTPStatusError as exc:
+                # Client errors are the request's fault, not the backend's
+                if exc.response.status_code < 500:
+                    self.breaker.record_success(time.monotonic() - start)
+                else:
+                    self.breaker.record_failure()
+                raise
+            except (httpx.HTTPError, ValueError):
+                self.breaker.record_failure()
+                raise
+            self.breaker.record_success(time.monotonic() - start)
+            return results
+        finally:
+            async with self._slots:
+                self._in_flight -= 1
+                self._slots.notify_all()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
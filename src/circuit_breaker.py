@@ -0,0 +1,136 @@
+"""
+Circuit Breaker and Adaptive Concurrency
+
+Protects callers from a slow or unavailable backend. After a number of
+consecutive failures the breaker opens and calls fail fast; after a backoff
+period a single probe request is let through (half-open) and closes the
+breaker again on success. The backoff doubles on every failed probe.
+
+The breaker also keeps a smoothed latency and derives a concurrency limit from
+it (additive increase, multiplicative decrease), which async clients use to
+size the number of in-flight requests.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class BackendUnavailableError(Exception):
+    """Raised when a call failed because the backend is temporarily unavailable; retry after `retry_after` seconds."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(BackendUnavailableError):
+    """Raised when a call is rejected because the circuit breaker is open."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Circuit breaker open, retry after {retry_after:.1f}s", retry_after)
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker with exponential backoff and a latency-driven concurrency limit."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 5.0, max_reset_timeout: float = 300.0,
+                 max_concurrency: int = 4, target_latency: float = 1.0, probe_timeout: float = 60.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.max_concurrency = max(1, max_concurrency)
+        self.target_latency = target_latency
+        self.probe_timeout = probe_timeout
+
+        self.concurrency_limit = self.max_concurrency
+        self.latency = None
+        self.failures = 0
+        self.rejected = 0
+
+        self._state = CLOSED
+        self._backoff = reset_timeout
+        self._opened_at = 0.0
+        self._probing = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open (open and due for a probe)."""
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self._backoff:
+                return HALF_OPEN
+            return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls are being rejected."""
+        return self.state == OPEN
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the next probe is allowed (0 when closed)."""
+        with self._lock:
+            if self._state == CLOSED:
+                return 0.0
+            return max(0.0, self._backoff - (time.monotonic() - self._opened_at))
+
+    def before_call(self) -> None:
+        """Admit a call or raise CircuitOpenError. In half-open state only one probe is admitted."""
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            now = time.monotonic()
+            elapsed = now - self._opened_at
+            # A probe that never reported back (e.g. cancelled) does not block new probes forever
+            probe_stale = self._probing and now - self._probe_started >= self.probe_timeout
+            if elapsed >= self._backoff and (not self._probing or probe_stale):
+                self._probing = True
+                self._probe_started = now
+                return
+            self.rejected += 1
+            raise CircuitOpenError(max(0.0, self._backoff - elapsed))
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful call and adapt the concurrency limit to its latency."""
+        with self._lock:
+            self.failures = 0
+            self._state = CLOSED
+            self._probing = False
+            self._backoff = self.reset_timeout
+
+            self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+            if self.latency > self.target_latency:
+                self.concurrency_limit = max(1, self.concurrency_limit // 2)
+            elif self.concurrency_limit < self.max_concurrency:
+                self.concurrency_limit += 1
+
+    def record_failure(self) -> None:
+        """Record a failed call; opens the breaker after `failure_threshold` consecutive failures."""
+        with self._lock:
+            self.failures += 1
+            self.concurrency_limit = max(1, self.concurrency_limit // 2)
+            if self._probing:
+                # Failed probe: stay open and back off further
+                self._probing = False
+                self._backoff = min(self.max_reset_timeout, self._backoff * 2)
+                self._opened_at = time.monotonic()
+            elif self._state == CLOSED and self.failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the breaker state, counters and adaptive concurrency."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "retry_after": self.retry_after,
+            "latency": self.latency,
+            "concurrency_limit": self.concurrency_limit,
+        }
@@ -0,0 +1,64 @@
+"""
+Location Doc Cache
+
+Persistent store of the spaCy Docs produced by SpacyGeoAnalyzer, keyed on the
+text hash and the model version, so documents can be re-geocoded (e.g. after a
+gazetteer update) without running the location model again. Each Doc is kept
+as compact DocBin bytes holding only tokens, whitespace and entities.
+"""
+
+from typing import Any, Dict, Optional
+
+from .ner_config import NER_CACHE_SETTINGS, GEO_NER_SETTINGS
+from .ner_result_cache import text_hash
+from .sqlite_cache import SqliteCache
+
+# Token attributes kept per Doc: enough for doc.text and doc.ents
+DOC_ATTRS = ["ORTH", "SPACY", "ENT_IOB", "ENT_TYPE"]
+
+
+class DocCache:
+    """Bounded LRU store of DocBin-serialized Docs, backed by `SqliteCache`."""
+
+    def __init__(self, path: str, ttl: Optional[float] = None, max_entries: int = 200_000):
+        self._store = SqliteCache(path, table="geo_docs", max_entries=max_entries, ttl=ttl,
+                                  encode=lambda data: data, decode=lambda data: data)
+
+    @staticmethod
+    def key(text: str, version: str) -> str:
+        return f"{text_hash(text)}|{version}"
+
+    def get(self, key: str, vocab: Any) -> Optional[Any]:
+        """Return the cached Doc rehydrated on `vocab`, or None on a miss."""
+        data = self._store.get(key)
+        if data is None:
+            return None
+        from spacy.tokens import DocBin
+        return next(DocBin(attrs=DOC_ATTRS).from_bytes(data).get_docs(vocab))
+
+    def set(self, key: str, doc: Any) -> None:
+        from spacy.tokens import DocBin
+        doc_bin = DocBin(attrs=DOC_ATTRS, store_user_data=False)
+        doc_bin.add(doc)
+        self._store.set(key, doc_bin.to_bytes())
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._store.stats()
+
+
+_cache: Optional[DocCache] = None
+
+
+def get_doc_cache() -> Optional[DocCache]:
+    """Return the shared Doc cache, or None if NER_CACHE_PATH is not set or NER_DOC_CACHE is off."""
+    global _cache
+    if _cache is None and NER_CACHE_SETTINGS['path'] and GEO_NER_SETTINGS['doc_cache']:
+        _cache = DocCache(
+            NER_CACHE_SETTINGS['path'],
+            ttl=GEO_NER_SETTINGS['doc_cache_ttl'],
+            max_entries=GEO_NER_SETTINGS['doc_cache_max_entries']
+        )
+    return _cache
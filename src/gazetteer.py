@@ -0,0 +1,195 @@
+"""
+Offline Street Gazetteer
+
+Local index of street names to geometry and centroid, built once from an
+OSM or basisregister extract. Lookups are answered in-process so that plain
+street names do not need a Nominatim round trip; Nominatim is only used as a
+fallback for names the gazetteer does not know.
+
+Build the index with:
+
+    python -m src.gazetteer build streets.geojson gazetteer.sqlite --city Gent
+
+The extract is a GeoJSON FeatureCollection (or newline-delimited GeoJSON),
+e.g. exported with `osmium export` or `ogr2ogr`, with the street name in the
+`name` (or `straatnaam`) property and the municipality in `addr:city`,
+`gemeentenaam` or `city`.
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import threading
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .geocode_cache import normalize_query
+from .geometry import bbox, centroid, merge_geometries
+
+NAME_PROPERTIES = ("name", "straatnaam", "STRAATNM")
+CITY_PROPERTIES = ("addr:city", "gemeentenaam", "city", "municipality", "GEMEENTE")
+
+
+class StreetGazetteer:
+    """
+    In-process street name index backed by a compact SQLite file.
+
+    Names and centroids are held in memory; geometries stay compressed on
+    disk and are only read for hits.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._index: Dict[Tuple[str, str], Tuple[int, str, str, float, float]] = {}
+        for rowid, name_norm, city_norm, name, city, lat, lon in self._conn.execute(
+                "SELECT rowid, name_norm, city_norm, name, city, lat, lon FROM streets"):
+            self._index[(name_norm, city_norm)] = (rowid, name, city, lat, lon)
+        self.logger.info(f"Loaded street gazetteer with {len(self._index)} streets from {path}")
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name_city: Tuple[str, str]) -> bool:
+        name, city = name_city
+        return (normalize_query(name), normalize_query(city)) in self._index
+
+    def names(self, city: Optional[str] = None) -> List[str]:
+        """Return all street names, optionally only those in `city`."""
+        city_norm = normalize_query(city) if city else None
+        return [entry[1] for (_, c), entry in self._index.items() if city_norm is None or c == city_norm]
+
+    def search(self, query: str, city: str = "Gent") -> Optional[Dict[str, Any]]:
+        """Look up a street name and return it in NominatimGeocoder's result format."""
+        entry = self._index.get((normalize_query(query), normalize_query(city)))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        rowid, name, city_name, lat, lon = entry
+        with self._lock:
+            blob = self._conn.execute("SELECT geojson FROM streets WHERE rowid = ?", (rowid,)).fetchone()[0]
+        geojson = json.loads(zlib.decompress(blob))
+
+        return {
+            "query": query,
+            "display_name": f"{name}, {city_name}" if city_name else name,
+            "lat": lat,
+            "lon": lon,
+            "importance": None,
+            "place_id": None,
+            "osm_type": None,
+            "osm_id": None,
+            "osm_url": None,
+            "address": {
+                "house_number": None,
+                "road": name,
+                "city": city_name,
+                "postcode": None,
+                "country": None,
+                "country_code": "be",
+            },
+            "bbox": bbox(geojson),
+            "type": "street",
+            "class": "highway",
+            "geojson": geojson,
+            "source": "gazetteer",
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and index size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+    @staticmethod
+    def build(extract_path: str, index_path: str, default_city: Optional[str] = None) -> int:
+        """
+        Build a gazetteer index from a GeoJSON street extract.
+
+        Features sharing a name and municipality (e.g. the separate OSM ways of
+        one street) are merged into a single entry.
+
+        Returns:
+            Number of streets written to the index
+        """
+        grouped: Dict[Tuple[str, str], Dict[str, Any]] = defaultdict(lambda: {"geometries": []})
+        for feature in _read_features(extract_path):
+            props = feature.get("properties") or {}
+            name = next((props[p] for p in NAME_PROPERTIES if props.get(p)), None)
+            city = next((props[p] for p in CITY_PROPERTIES if props.get(p)), default_city)
+            geometry = feature.get("geometry")
+            if not name or not geometry:
+                continue
+            entry = grouped[(normalize_query(name), normalize_query(city))]
+            entry["name"], entry["city"] = name, city
+            entry["geometries"].append(geometry)
+
+        conn = sqlite3.connect(index_path)
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS streets")
+            conn.execute(
+                "CREATE TABLE streets ("
+                " name_norm TEXT NOT NULL, city_norm TEXT NOT NULL,"
+                " name TEXT NOT NULL, city TEXT,"
+                " lat REAL NOT NULL, lon REAL NOT NULL,"
+                " geojson BLOB NOT NULL,"
+                " PRIMARY KEY (name_norm, city_norm))")
+            rows = []
+            for (name_norm, city_norm), entry in grouped.items():
+                geometry = merge_geometries(entry["geometries"])
+                center = centroid(geometry)
+                if center is None:
+                    continue
+                blob = zlib.compress(json.dumps(geometry, separators=(",", ":")).encode("utf-8"))
+                rows.append((name_norm, city_norm, entry["name"], entry["city"], center[0], center[1], blob))
+            conn.executemany("INSERT INTO streets VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.execute("VACUUM")
+        conn.close()
+        return len(rows)
+
+
+def _read_features(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield features from a GeoJSON FeatureCollection or newline-delimited GeoJSON file."""
+    with open(path, encoding="utf-8") as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        if first == "{":
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError:
+                data = None
+            if data is not None:
+                yield from data.get("features", [data] if data.get("type") == "Feature" else [])
+                return
+            f.seek(0)
+        for line in f:
+            line = line.strip().lstrip("\x1e")
+            if line:
+                yield json.loads(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Street gazetteer tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Build a gazetteer index from a GeoJSON extract")
+    build.add_argument("extract", help="GeoJSON (or newline-delimited GeoJSON) street extract")
+    build.add_argument("index", help="Output SQLite index path")
+    build.add_argument("--city", default=None, help="Municipality for features without one")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        count = StreetGazetteer.build(args.extract, args.index, default_city=args.city)
+        print(f"Wrote {count} streets to {args.index}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Geocode Result Cache
+
+Persistent cache placed in front of the Nominatim geocoder so repeated lookups
+of the same street or address are answered locally.
+
+Empty results are cached as well, with a shorter TTL, and queries that keep
+coming back empty are tracked in a small "known unresolvable" index so they
+are short-circuited without hitting Nominatim.
+"""
+
+import re
+import unicodedata
+from typing import Any, Dict, Optional, Tuple
+
+from .sqlite_cache import SqliteCache
+
+
+def normalize_query(value: Optional[str]) -> str:
+    """Normalize a query component: casefold, strip accents and collapse whitespace."""
+    if not value:
+        return ""
+    value = unicodedata.normalize('NFKD', value)
+    value = "".join(c for c in value if not unicodedata.combining(c))
+    value = re.sub(r'\s+', ' ', value).strip().casefold()
+    return value
+
+
+def cache_key(query: str, city: Optional[str], country: Optional[str], limit: int,
+              geometry: str = "full", tolerance: Optional[float] = None) -> str:
+    """Build the cache key for a geocoding request."""
+    parts = [normalize_query(query), normalize_query(city), normalize_query(country), str(limit)]
+    if geometry != "full":
+        parts.append(f"{geometry}:{tolerance}" if geometry == "simplified" else geometry)
+    return "|".join(parts)
+
+
+class GeocodeCache:
+    """
+    Cache of formatted geocoding results keyed on the normalized request.
+
+    Backed by `SqliteCache`, so entries survive restarts when the cache file is
+    stored on a mounted volume.
+    """
+
+    def __init__(self, path: str, ttl: float = 30 * 24 * 3600, max_entries: int = 100_000,
+                 negative_ttl: float = 24 * 3600, unresolvable_after: int = 3,
+                 unresolvable_ttl: float = 90 * 24 * 3600, max_unresolvable: int = 10_000):
+        self.negative_ttl = negative_ttl
+        self.unresolvable_after = max(1, unresolvable_after)
+        self.negative_hits = 0
+        self._store = SqliteCache(path, table="geocode", max_entries=max_entries, ttl=ttl)
+        self._failures = SqliteCache(path, table="geocode_failures", max_entries=max_unresolvable,
+                                     ttl=unresolvable_ttl)
+
+    def lookup(self, key: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up a request in the cache.
+
+        Returns:
+            (found, result): `found` is True on a cache hit; `result` is None
+            for a cached empty result or a known unresolvable query.
+        """
+        entry = self._store.get(key)
+        if entry is not None:
+            if entry.get("found", True) is False:
+                self.negative_hits += 1
+                return True, None
+            return True, entry
+        if self.is_unresolvable(key):
+            self.negative_hits += 1
+            return True, None
+        return False, None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for `key`, or None on a miss or negative entry."""
+        return self.lookup(key)[1]
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Cache a geocoding result."""
+        self._store.set(key, result)
+        self._failures.delete(key)
+
+    def set_negative(self, key: str) -> None:
+        """Cache an empty result and count it towards the unresolvable index."""
+        self._store.set(key, {"found": False}, ttl=self.negative_ttl)
+        failures = self._failures.get(key, 0)
+        self._failures.set(key, failures + 1)
+
+    def is_unresolvable(self, key: str) -> bool:
+        """True if the query came back empty at least `unresolvable_after` times."""
+        return self._failures.get(key, 0) >= self.unresolvable_after
+
+    def clear(self) -> None:
+        """Drop all cached results and the unresolvable index."""
+        self._store.clear()
+        self._failures.clear()
+        self.negative_hits = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and cache size."""
+        return {
+            **self._store.stats(),
+            "negative_hits": self.negative_hits,
+            "tracked_failures": len(self._failures),
+        }
@@ -0,0 +1,133 @@
+"""
+Nominatim Backend Pool
+
+Spreads geocoding requests over several Nominatim replicas. Each backend has
+its own rate budget, concurrency limit and circuit breaker; requests go to the
+backend with the lowest expected wait (outstanding requests weighted by
+observed latency) and fail over to the next one on errors.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from .async_nominatim_geocoder import AsyncNominatimGeocoder
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .gazetteer import StreetGazetteer
+from .geocode_cache import GeocodeCache
+
+
+class _Backend:
+    """One Nominatim endpoint in the pool with its request statistics."""
+
+    def __init__(self, geocoder: AsyncNominatimGeocoder):
+        self.geocoder = geocoder
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.latency: Optional[float] = None
+
+    def score(self, default_latency: float) -> float:
+        """Expected wait for a new request: (outstanding + 1) x smoothed latency."""
+        latency = self.latency if self.latency is not None else default_latency
+        return (self.outstanding + 1) * latency
+
+    def observe(self, latency: float) -> None:
+        self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.geocoder.base_url,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "failures": self.failures,
+            "latency": self.latency,
+            "breaker": self.geocoder.breaker.stats(),
+        }
+
+
+class NominatimPool(AsyncNominatimGeocoder):
+    """
+    AsyncNominatimGeocoder over several Nominatim endpoints.
+
+    Caching, the gazetteer, request coalescing and the `search` contract are
+    inherited; only the HTTP request is dispatched to one of the backends.
+    `requests_per_second` and `max_concurrency` apply per endpoint.
+    """
+
+    def __init__(self, base_urls: List[str], requests_per_second: float = 2.0, max_concurrency: int = 4,
+                 timeout: float = 10.0, cache: Optional[GeocodeCache] = None,
+                 gazetteer: Optional[StreetGazetteer] = None,
+                 breaker_factory: Callable[[], CircuitBreaker] = None):
+        if not base_urls:
+            raise ValueError("NominatimPool needs at least one base URL")
+        super().__init__(base_urls[0], requests_per_second=requests_per_second,
+                         max_concurrency=max_concurrency * len(base_urls), timeout=timeout,
+                         cache=cache, gazetteer=gazetteer)
+        breaker_factory = breaker_factory or (lambda: CircuitBreaker(max_concurrency=max_concurrency))
+        self.backends = [
+            _Backend(AsyncNominatimGeocoder(url, requests_per_second=requests_per_second,
+                                            max_concurrency=max_concurrency, timeout=timeout,
+                                            breaker=breaker_factory()))
+            for url in base_urls
+        ]
+
+    @property
+    def available(self) -> bool:
+        """True if at least one backend accepts requests."""
+        return any(backend.geocoder.available for backend in self.backends)
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the first backend accepts requests again."""
+        return min(backend.geocoder.retry_after for backend in self.backends)
+
+    @property
+    def recovering(self) -> bool:
+        """True if no backend's circuit breaker is closed."""
+        return all(backend.geocoder.recovering for backend in self.backends)
+
+    def _candidates(self) -> List[_Backend]:
+        """Backends in order of preference: available ones first, lowest expected wait first."""
+        # Backends without latency samples yet are tried first
+        default_latency = 0.0
+        return sorted(self.backends, key=lambda b: (not b.geocoder.available, b.score(default_latency)))
+
+    async def _fetch(self, query: str, city: str, limit: int, country: str,
+                     geometry: str = "full", tolerance: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Send the request to the best backend, failing over to the others on errors."""
+        last_error: Optional[Exception] = None
+        for backend in self._candidates():
+            backend.outstanding += 1
+            backend.requests += 1
+            start = time.monotonic()
+            try:
+                results = await backend.geocoder._fetch(query, city, limit, country, geometry, tolerance)
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code < 500:
+                    raise
+                backend.failures += 1
+                last_error = exc
+            except CircuitOpenError as exc:
+                last_error = exc
+            except (httpx.HTTPError, ValueError) as exc:
+                backend.failures += 1
+                last_error = exc
+            else:
+                backend.observe(time.monotonic() - start)
+                return results
+            finally:
+                backend.outstanding -= 1
+            self.logger.info("Nominatim backend %s failed for %r, trying next: %s",
+                             backend.geocoder.base_url, query, last_error)
+        raise last_error
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-backend request, failure, latency and breaker statistics."""
+        return [backend.stats() for backend in self.backends]
+
+    async def aclose(self) -> None:
+        """Close the HTTP clients of all backends."""
+        for backend in self.backends:
+            await backend.geocoder.aclose()
@@ -0,0 +1,91 @@
+"""
+Geocoding Setup
+
+Factory functions that assemble the geocoding components from
+GEOCODING_SETTINGS.
+"""
+
+from typing import Optional
+
+from .async_nominatim_geocoder import AsyncNominatimGeocoder
+from .circuit_breaker import CircuitBreaker
+from .gazetteer import StreetGazetteer
+from .geocode_cache import GeocodeCache
+from .geocoder_pool import NominatimPool
+from .geocoding_config import GEOCODING_SETTINGS
+from .street_matcher import StreetNameMatcher
+
+
+def create_gazetteer() -> Optional[StreetGazetteer]:
+    """Load the offline street gazetteer, if one is configured."""
+    if not GEOCODING_SETTINGS["gazetteer_path"]:
+        return None
+    return StreetGazetteer(GEOCODING_SETTINGS["gazetteer_path"])
+
+
+def create_geocode_cache() -> Optional[GeocodeCache]:
+    """Open the persistent geocode cache, if one is configured."""
+    if not GEOCODING_SETTINGS["cache_path"]:
+        return None
+    return GeocodeCache(
+        GEOCODING_SETTINGS["cache_path"],
+        ttl=GEOCODING_SETTINGS["cache_ttl"],
+        max_entries=GEOCODING_SETTINGS["cache_max_entries"],
+        negative_ttl=GEOCODING_SETTINGS["negative_ttl"],
+        unresolvable_after=GEOCODING_SETTINGS["unresolvable_after"],
+        unresolvable_ttl=GEOCODING_SETTINGS["unresolvable_ttl"]
+    )
+
+
+def create_geocoder(gazetteer: Optional[StreetGazetteer] = None) -> AsyncNominatimGeocoder:
+    """
+    Create the Nominatim geocoder used by the geo extraction tasks: a
+    NominatimPool when several replicas are configured, otherwise a single
+    AsyncNominatimGeocoder.
+    """
+    if len(GEOCODING_SETTINGS["base_urls"]) > 1:
+        return NominatimPool(
+            GEOCODING_SETTINGS["base_urls"],
+            requests_per_second=GEOCODING_SETTINGS["requests_per_second"],
+            max_concurrency=GEOCODING_SETTINGS["max_concurrency"],
+            timeout=GEOCODING_SETTINGS["timeout"],
+            cache=create_geocode_cache(),
+            gazetteer=gazetteer,
+            breaker_factory=create_circuit_breaker
+        )
+    return AsyncNominatimGeocoder(
+        base_url=(GEOCODING_SETTINGS["base_urls"] or [GEOCODING_SETTINGS["base_url"]])[0],
+        requests_per_second=GEOCODING_SETTINGS["requests_per_second"],
+        max_concurrency=GEOCODING_SETTINGS["max_concurrency"],
+        timeout=GEOCODING_SETTINGS["timeout"],
+        cache=create_geocode_cache(),
+        gazetteer=gazetteer,
+        breaker=create_circuit_breaker()
+    )
+
+
+def create_circuit_breaker() -> CircuitBreaker:
+    """Create a circuit breaker for one Nominatim backend."""
+    return CircuitBreaker(
+        failure_threshold=GEOCODING_SETTINGS["failure_threshold"],
+        reset_timeout=GEOCODING_SETTINGS["reset_timeout"],
+        max_reset_timeout=GEOCODING_SETTINGS["max_reset_timeout"],
+        max_concurrency=GEOCODING_SETTINGS["max_concurrency"],
+        target_latency=GEOCODING_SETTINGS["target_latency"]
+    )
+
+
+def create_street_matcher(gazetteer: Optional[StreetGazetteer] = None) -> Optional[StreetNameMatcher]:
+    """
+    Create the fuzzy street name matcher from the gazetteer and/or the
+    configured street name list. Returns None if neither is available.
+    """
+    names = []
+    if gazetteer is not None:
+        names.extend(gazetteer.names())
+    if GEOCODING_SETTINGS["street_names_path"]:
+        with open(GEOCODING_SETTINGS["street_names_path"], encoding="utf-8") as f:
+            names.extend(line.strip() for line in f if line.strip())
+    if not names:
+        return None
+    return StreetNameMatcher(names, threshold=GEOCODING_SETTINGS["fuzzy_threshold"])
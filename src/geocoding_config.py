@@ -0,0 +1,58 @@
+"""
+Geocoding Configuration
+
+This module contains the settings used by the geocoding workflow. Values can be
+overridden through environment variables so they can be tuned per deployment in
+docker-compose without code changes.
+"""
+
+import os
+
+GEOCODING_SETTINGS = {
+    # Nominatim backend
+    'base_url': os.getenv("NOMINATIM_BASE_URL", "http://localhost:8080"),
+    # Comma-separated list of Nominatim replicas; overrides base_url when set
+    'base_urls': [url.strip() for url in os.getenv("NOMINATIM_BASE_URLS", "").split(",") if url.strip()],
+    'timeout': float(os.getenv("NOMINATIM_TIMEOUT", "10")),
+    'requests_per_second': float(os.getenv("NOMINATIM_REQUESTS_PER_SECOND", "2")),
+    'max_concurrency': int(os.getenv("NOMINATIM_MAX_CONCURRENCY", "4")),
+
+    # Circuit breaker: open after N consecutive failures, probe again after a
+    # backoff that doubles per failed probe; halve concurrency above the target latency
+    'failure_threshold': int(os.getenv("NOMINATIM_FAILURE_THRESHOLD", "5")),
+    'reset_timeout': float(os.getenv("NOMINATIM_RESET_TIMEOUT", "5")),
+    'max_reset_timeout': float(os.getenv("NOMINATIM_MAX_RESET_TIMEOUT", "300")),
+    'target_latency': float(os.getenv("NOMINATIM_TARGET_LATENCY", "1.0")),
+
+    # Geometry returned for streets: full, simplified, centroid or none.
+    # Addresses are always geocoded to a point. Tolerance is in degrees.
+    'street_geometry': os.getenv("GEOCODE_STREET_GEOMETRY", "simplified"),
+    'geometry_tolerance': float(os.getenv("GEOCODE_GEOMETRY_TOLERANCE", "0.00001")),
+
+    # Persistent result cache (disabled when no path is set)
+    'cache_path': os.getenv("GEOCODE_CACHE_PATH"),
+    'cache_ttl': float(os.getenv("GEOCODE_CACHE_TTL", str(30 * 24 * 3600))),
+    'cache_max_entries': int(os.getenv("GEOCODE_CACHE_MAX_ENTRIES", "100000")),
+
+    # Negative caching of empty results and the "known unresolvable" index
+    'negative_ttl': float(os.getenv("GEOCODE_NEGATIVE_TTL", str(24 * 3600))),
+    'unresolvable_after': int(os.getenv("GEOCODE_UNRESOLVABLE_AFTER", "3")),
+    'unresolvable_ttl': float(os.getenv("GEOCODE_UNRESOLVABLE_TTL", str(90 * 24 * 3600))),
+
+    # Offline street gazetteer consulted before Nominatim (disabled when no path is set)
+    'gazetteer_path': os.getenv("GAZETTEER_PATH"),
+
+    # Fuzzy street name matching; known names come from the gazetteer and/or
+    # a text file with one street name per line
+    'street_names_path': os.getenv("STREET_NAMES_PATH"),
+    'fuzzy_threshold': float(os.getenv("STREET_MATCH_THRESHOLD", "0.75")),
+
+    # Basisregisters Vlaanderen street/address URI lookups
+    'registry_pool_size': int(os.getenv("REGISTRY_POOL_SIZE", "8")),
+    'registry_cache_ttl': float(os.getenv("REGISTRY_CACHE_TTL", str(7 * 24 * 3600))),
+    'registry_cache_max_entries': int(os.getenv("REGISTRY_CACHE_MAX_ENTRIES", "50000")),
+
+    # Local snapshot of the address register; offline_only skips the API for snapshot misses
+    'registry_snapshot_path': os.getenv("REGISTRY_SNAPSHOT_PATH"),
+    'registry_offline_only': os.getenv("REGISTRY_OFFLINE_ONLY", "false").lower() in ("1", "true", "yes"),
+}
@@ -0,0 +1,198 @@
+"""
+GeoJSON Geometry Helpers
+
+Small, dependency-free helpers for the GeoJSON geometries returned by
+Nominatim and stored in the street gazetteer.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+def iter_coordinates(geometry: Dict[str, Any]) -> Iterator[Tuple[float, float]]:
+    """Yield all (lon, lat) positions of a GeoJSON geometry."""
+    if not geometry:
+        return
+    if geometry.get("type") == "GeometryCollection":
+        for part in geometry.get("geometries", []):
+            yield from iter_coordinates(part)
+        return
+
+    def walk(coords):
+        if coords and isinstance(coords[0], (int, float)):
+            yield float(coords[0]), float(coords[1])
+        else:
+            for c in coords:
+                yield from walk(c)
+
+    yield from walk(geometry.get("coordinates", []))
+
+
+def centroid(geometry: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """Return the (lat, lon) mean of all vertices of a geometry, or None if empty."""
+    n = 0
+    sum_lon = sum_lat = 0.0
+    for lon, lat in iter_coordinates(geometry):
+        sum_lon += lon
+        sum_lat += lat
+        n += 1
+    if not n:
+        return None
+    return sum_lat / n, sum_lon / n
+
+
+def bbox(geometry: Dict[str, Any]) -> Optional[List[str]]:
+    """Return the bounding box in Nominatim's [min_lat, max_lat, min_lon, max_lon] string format."""
+    coords = list(iter_coordinates(geometry))
+    if not coords:
+        return None
+    lons = [c[0] for c in coords]
+    lats = [c[1] for c in coords]
+    return [str(min(lats)), str(max(lats)), str(min(lons)), str(max(lons))]
+
+
+def merge_geometries(geometries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge (Multi)LineStrings into one MultiLineString; other types into a GeometryCollection."""
+    if len(geometries) == 1:
+        return geometries[0]
+    lines = []
+    for geometry in geometries:
+        if geometry.get("type") == "LineString":
+            lines.append(geometry["coordinates"])
+        elif geometry.get("type") == "MultiLineString":
+            lines.extend(geometry["coordinates"])
+        else:
+            return {"type": "GeometryCollection", "geometries": geometries}
+    return {"type": "MultiLineString", "coordinates": lines}
+
+
+def _is_position(p: Any) -> bool:
+    return (isinstance(p, (list, tuple)) and len(p) >= 2
+            and all(isinstance(c, (int, float)) and not isinstance(c, bool) for c in p[:2]))
+
+
+def _is_line(points: Any, min_points: int = 2) -> bool:
+    return isinstance(points, (list, tuple)) and len(points) >= min_points and all(_is_position(p) for p in points)
+
+
+def _is_ring(points: Any) -> bool:
+    """A closed linear ring: at least 4 positions, the last equal to the first."""
+    return _is_line(points, 4) and list(points[0][:2]) == list(points[-1][:2])
+
+
+def _is_polygon(rings: Any) -> bool:
+    return isinstance(rings, (list, tuple)) and len(rings) >= 1 and all(_is_ring(r) for r in rings)
+
+
+def _wkt_points(points: List[List[float]]) -> str:
+    return "(" + ", ".join(f"{p[0]} {p[1]}" for p in points) + ")"
+
+
+def to_wkt(geometry: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Return the WKT of a GeoJSON geometry.
+
+    Returns None if there is no geometry, its type is unsupported or its
+    coordinates are malformed (e.g. a polygon ring that is not closed).
+    """
+    if not geometry:
+        return None
+    kind = geometry.get("type")
+    coords = geometry.get("coordinates")
+    if kind == "Point" and _is_position(coords):
+        return f"POINT({coords[0]} {coords[1]})"
+    if kind == "MultiPoint" and _is_line(coords, 1):
+        return "MULTIPOINT" + _wkt_points(coords)
+    if kind == "LineString" and _is_line(coords):
+        return "LINESTRING" + _wkt_points(coords)
+    if kind == "MultiLineString" and coords and all(_is_line(line) for line in coords):
+        return "MULTILINESTRING(" + ", ".join(_wkt_points(line) for line in coords) + ")"
+    if kind == "Polygon" and _is_polygon(coords):
+        return "POLYGON(" + ", ".join(_wkt_points(r) for r in coords) + ")"
+    if kind == "MultiPolygon" and coords and all(_is_polygon(polygon) for polygon in coords):
+        return "MULTIPOLYGON(" + ", ".join(
+            "(" + ", ".join(_wkt_points(r) for r in polygon) + ")" for polygon in coords) + ")"
+    if kind == "GeometryCollection":
+        parts = [to_wkt(part) for part in geometry.get("geometries", [])]
+        if not parts or None in parts:
+            return None
+        return "GEOMETRYCOLLECTION(" + ", ".join(parts) + ")"
+    return None
+
+
+GEOMETRY_MODES = ("full", "simplified", "centroid", "none")
+
+
+def _perpendicular_distance(point, start, end) -> float:
+    """Distance from `point` to the line through `start` and `end` (planar, in degrees)."""
+    (x, y), (x1, y1), (x2, y2) = point, start, end
+    dx, dy = x2 - x1, y2 - y1
+    if dx == 0 and dy == 0:
+        return ((x - x1) ** 2 + (y - y1) ** 2) ** 0.5
+    return abs(dy * x - dx * y + x2 * y1 - y2 * x1) / (dx * dx + dy * dy) ** 0.5
+
+
+def douglas_peucker(points: List[List[float]], tolerance: float) -> List[List[float]]:
+    """Simplify a line with the Douglas-Peucker algorithm (iterative, keeps end points)."""
+    if len(points) < 3:
+        return points
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        max_dist, index = 0.0, None
+        for i in range(first + 1, last):
+            dist = _perpendicular_distance(points[i], points[first], points[last])
+            if dist > max_dist:
+                max_dist, index = dist, i
+        if index is not None and max_dist > tolerance:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return [p for p, k in zip(points, keep) if k]
+
+
+def simplify(geometry: Dict[str, Any], tolerance: float) -> Dict[str, Any]:
+    """Simplify the lines and polygon rings of a GeoJSON geometry."""
+    if not geometry or tolerance <= 0:
+        return geometry
+    kind = geometry.get("type")
+    coords = geometry.get("coordinates")
+
+    def ring(points):
+        simplified = douglas_peucker(points, tolerance)
+        return simplified if len(simplified) >= 4 else points
+
+    if kind == "LineString":
+        return {"type": kind, "coordinates": douglas_peucker(coords, tolerance)}
+    if kind == "MultiLineString":
+        return {"type": kind, "coordinates": [douglas_peucker(line, tolerance) for line in coords]}
+    if kind == "Polygon":
+        return {"type": kind, "coordinates": [ring(r) for r in coords]}
+    if kind == "MultiPolygon":
+        return {"type": kind, "coordinates": [[ring(r) for r in polygon] for polygon in coords]}
+    if kind == "GeometryCollection":
+        return {"type": kind, "geometries": [simplify(g, tolerance) for g in geometry.get("geometries", [])]}
+    return geometry
+
+
+def apply_geometry_mode(result: Dict[str, Any], mode: str, tolerance: Optional[float] = None,
+                        simplify_locally: bool = True) -> Dict[str, Any]:
+    """
+    Reduce the `geojson` of a geocoding result according to `mode`.
+
+    - full: keep the geometry as is
+    - simplified: Douglas-Peucker with `tolerance` (skipped when the backend
+      already simplified, i.e. `simplify_locally=False`)
+    - centroid: replace the geometry by a Point at the result's lat/lon
+    - none: drop the geometry
+    """
+    if mode == "full":
+        return result
+    if mode == "simplified":
+        if not simplify_locally or not tolerance:
+            return result
+        return {**result, "geojson": simplify(result.get("geojson"), tolerance)}
+    if mode == "centroid":
+        return {**result, "geojson": {"type": "Point", "coordinates": [result["lon"], result["lat"]]}}
+    return {**result, "geojson": None}
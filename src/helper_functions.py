@@ -1,9 +1,11 @@
-import os
 import re
+import asyncio
 import unicodedata
-import requests
 from typing import Optional
 
+from .geocode_cache import cache_key
+from .registry_client import get_registry_client
+
 
 def clean_string(input_string):
     """Remove extra whitespace and normalize string formatting."""
@@ -209,22 +211,33 @@ def process_text(text, ner_model, from_city="Gent"):
     return detectables, doc.ents, doc
 
 
-def geocode_detectable(detectable, geocoder, default_city="Gent"):
-    """Geocode a detected entity (address or street) and return GeoJSON result."""
+def detectable_query(detectable, default_city="Gent", matcher=None):
+    """
+    Build the geocoding query and city for a detected entity.
+
+    With a StreetNameMatcher, street and address names are first canonicalized
+    to the closest known street. Returns (query, city, match_score), where
+    match_score is None when no matcher was used or nothing matched.
+    """
     name = detectable.get("name", "")
-    if not name:
-        return {"success": False, "error": "No name in detectable"}
+    match_score = None
+    if matcher is not None and detectable.get("type") in ("STREET", "ROAD", "HOUSE"):
+        match = matcher.match(name)
+        if match is not None:
+            name, match_score = match
 
     if detectable.get("type") == "HOUSE" and detectable.get("house_number"):
         query = f"{name} {detectable['house_number']}"
     else:
         query = name
-
     city = detectable.get("city", default_city)
-    result = geocoder.search(query, city=city)
+    return query, city, match_score
+
 
+def geocode_result(detectable, query, city, result, match_score=None):
+    """Wrap a geocoder search result into the geocode_detectable result format."""
     if result:
-        return {
+        geocoded = {
             "success": True,
             "query": query,
             "display_name": result["display_name"],
@@ -236,13 +249,87 @@ def geocode_detectable(detectable, geocoder, default_city="Gent"):
             "detectable": detectable
         }
     else:
-        return {
+        geocoded = {
             "success": False,
             "query": query,
             "city": city,
             "error": f"No geocoding result found for '{query}' in {city}",
             "detectable": detectable
         }
+    if match_score is not None:
+        geocoded["match_score"] = match_score
+    return geocoded
+
+
+def detectable_geometry(detectable, street_geometry="full"):
+    """Geometry mode to request for a detectable: addresses only need a point."""
+    return "centroid" if detectable.get("type") == "HOUSE" else street_geometry
+
+
+def geocode_detectable(detectable, geocoder, default_city="Gent", matcher=None,
+                       street_geometry="full", tolerance=None):
+    """Geocode a detected entity (address or street) and return GeoJSON result."""
+    if not detectable.get("name", ""):
+        return {"success": False, "error": "No name in detectable"}
+
+    query, city, match_score = detectable_query(detectable, default_city, matcher)
+    result = geocoder.search(query, city=city, geometry=detectable_geometry(detectable, street_geometry),
+                             tolerance=tolerance)
+    return geocode_result(detectable, query, city, result, match_score)
+
+
+def geocode_batch(detectables, geocoder, default_city="Gent", matcher=None,
+                  street_geometry="full", tolerance=None):
+    """
+    Geocode all detectables of a document with an AsyncNominatimGeocoder.
+
+    Identical queries (after canonicalization with `matcher`, if given) are
+    looked up once and the unique lookups run concurrently within the
+    geocoder's rate budget. Addresses are geocoded to a point; streets use
+    `street_geometry` (see NominatimGeocoder.search). Returns a dict with the same keys as `detectables`,
+    holding one geocode_detectable-style result per detectable.
+
+    Raises BackendUnavailableError (e.g. CircuitOpenError) when Nominatim is
+    unavailable, rather than returning partial results.
+    """
+    queries = {}
+    lookups = {}
+    for geo_entity, items in detectables.items():
+        queries[geo_entity] = []
+        for detectable in items:
+            if not detectable.get("name", ""):
+                queries[geo_entity].append(None)
+                continue
+            query, city, match_score = detectable_query(detectable, default_city, matcher)
+            geometry = detectable_geometry(detectable, street_geometry)
+            key = cache_key(query, city, "", 1, geometry, tolerance)
+            lookups.setdefault(key, (query, city, geometry))
+            queries[geo_entity].append((key, query, city, match_score))
+
+    async def resolve():
+        pending = list(lookups.values())
+        results = []
+        if getattr(geocoder, "recovering", False):
+            # A half-open breaker admits one probe: send it before fanning out the rest
+            query, city, geometry = pending.pop(0)
+            results.append(await geocoder.search(query, city=city, geometry=geometry, tolerance=tolerance))
+        results.extend(await asyncio.gather(*(
+            geocoder.search(query, city=city, geometry=geometry, tolerance=tolerance)
+            for query, city, geometry in pending)))
+        return dict(zip(lookups, results))
+
+    resolved = geocoder.run(resolve()) if lookups else {}
+
+    results = {}
+    for geo_entity, items in detectables.items():
+        results[geo_entity] = []
+        for detectable, lookup in zip(items, queries[geo_entity]):
+            if lookup is None:
+                results[geo_entity].append({"success": False, "error": "No name in detectable"})
+                continue
+            key, query, city, match_score = lookup
+            results[geo_entity].append(geocode_result(detectable, query, city, resolved[key], match_score))
+    return results
 
 
 def render_entities_html(doc):
@@ -267,44 +354,13 @@ def render_entities_html(doc):
 
 
 def get_street_uri(gemeentenaam: str, straatnaam: str, timeout: int = 15) -> Optional[str]:
-    """Retrieve the URI for a street from an external API."""
-    url = f"{os.getenv('BASE_REGISTRY_URI')}/v2/straatnamen/"
-    params = {"gemeentenaam": gemeentenaam, "straatnaam": straatnaam}
-    r = requests.get(url, params=params, headers={
-                     "Accept": "application/json"}, timeout=timeout)
-    r.raise_for_status()
-    data = r.json()
-
-    items = (data or {}).get("straatnamen", [])
-    if not items:
-        return None
-
-    ident = items[0].get("identificator", {})
-    return url + ident.get("objectId")
+    """Retrieve the URI for a street from an external API (pooled and cached)."""
+    return get_registry_client().street_uri(gemeentenaam, straatnaam, timeout=timeout)
 
 
 def get_address_uri(gemeentenaam: str, straatnaam: str, huisnummer: str, busnummer: Optional[str] = None, timeout: int = 15) -> Optional[str]:
-    """Retrieve the URI for a specific address from an external API."""
-    url = f"{os.getenv('BASE_REGISTRY_URI')}/v2/adressen/"
-    params = {
-        "gemeentenaam": gemeentenaam,
-        "straatnaam": straatnaam,
-        "huisnummer": huisnummer,
-    }
-    if busnummer is not None:
-        params["busnummer"] = busnummer
-
-    r = requests.get(url, params=params, headers={
-                     "Accept": "application/json"}, timeout=timeout)
-    r.raise_for_status()
-    data = r.json()
-
-    items = (data or {}).get("adressen", [])
-    if not items:
-        return None
-
-    ident = items[0].get("identificator", {})
-    return url + ident.get("objectId")
+    """Retrieve the URI for a specific address from an external API (pooled and cached)."""
+    return get_registry_client().address_uri(gemeentenaam, straatnaam, huisnummer, busnummer, timeout=timeout)
 
 
 def get_start_end_offsets(text: str, word: str) -> list:
@@ -0,0 +1,79 @@
+"""
+Micro-batching Scheduler
+
+Collects items submitted by concurrent callers for a few milliseconds and
+processes them together in one batch call, handing each caller its own
+result. Used to run model inference for concurrently running tasks as one
+batch.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Generic, List, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Batch items from many threads into calls of `process_batch`.
+
+    A batch is dispatched as soon as it holds `max_batch_size` items or
+    `max_wait` seconds have passed since its first item arrived.
+    `process_batch` must return one result per input item, in order.
+    """
+
+    def __init__(self, process_batch: Callable[[List[T]], List[R]], max_batch_size: int = 8,
+                 max_wait: float = 0.005, name: str = "micro-batcher"):
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait
+        self.batches = 0
+        self.items = 0
+        self.logger = logging.getLogger(__name__)
+
+        self._queue: "queue.Queue[Tuple[T, Future]]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    def submit(self, item: T) -> R:
+        """Queue an item and block until its result is available."""
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future.result()
+
+    def _collect(self) -> List[Tuple[T, Future]]:
+        """Wait for a first item, then gather more until the batch is full or max_wait expires."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            items = [item for item, _ in batch]
+            try:
+                results = self.process_batch(items)
+                if len(results) != len(items):
+                    raise RuntimeError(f"Batch returned {len(results)} results for {len(items)} items")
+            except Exception as e:
+                self.logger.error(f"Micro-batch of {len(items)} items failed: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.items += len(items)
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
@@ -0,0 +1,85 @@
+"""
+Model Warm-up and Readiness
+
+Loads the NER models in a background thread after the service has started, so
+the web server accepts requests (and health checks) immediately, and keeps
+track of which models are loaded for the readiness endpoint.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .ner_config import WARMUP_MODELS
+from .ner_models import model_manager
+
+logger = logging.getLogger(__name__)
+
+_status: Dict[str, Dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+def _set_status(name: str, state: str, **extra: Any) -> None:
+    with _lock:
+        _status[name] = {"state": state, **extra}
+
+
+def _warmup_loader(spec: str) -> Callable[[], Any]:
+    """Return a loader for a WARMUP_MODELS entry ("spacy:<language>", "flair:<model>" or "title")."""
+    kind, _, arg = spec.partition(":")
+    if kind == "spacy":
+        return lambda: model_manager.get_spacy_model(arg)
+    if kind == "flair":
+        return lambda: model_manager.get_flair_model(arg)
+    if kind == "title":
+        return model_manager.get_title_extraction_model
+    raise ValueError(f"Unknown warm-up model: {spec}")
+
+
+def _load(name: str, loader: Callable[[], Any]) -> None:
+    _set_status(name, "loading")
+    start = time.perf_counter()
+    try:
+        loaded = loader()
+    except Exception as e:
+        logger.error(f"Warm-up of {name} failed: {e}")
+        _set_status(name, "failed", error=str(e))
+        return
+    seconds = round(time.perf_counter() - start, 2)
+    if loaded is False:
+        _set_status(name, "failed", seconds=seconds)
+    else:
+        logger.info(f"Warmed up {name} in {seconds}s")
+        _set_status(name, "loaded", seconds=seconds)
+
+
+def start_warm_up(geo_analyzer: Any, models: Optional[List[str]] = None) -> threading.Thread:
+    """
+    Load the location model and the WARMUP_MODELS in a background thread.
+
+    Args:
+        geo_analyzer: SpacyGeoAnalyzer (created with lazy=True) to load
+        models: Extra model specs, defaults to WARMUP_MODELS
+    """
+    jobs = [("geo", geo_analyzer.ensure_loaded)]
+    for spec in WARMUP_MODELS if models is None else models:
+        jobs.append((spec, lambda spec=spec: _warmup_loader(spec)()))
+    for name, _ in jobs:
+        _set_status(name, "pending")
+
+    def run():
+        for name, loader in jobs:
+            _load(name, loader)
+
+    thread = threading.Thread(target=run, name="model-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def readiness() -> Dict[str, Any]:
+    """Return whether all warm-up models are loaded, with the state per model and model cache stats."""
+    with _lock:
+        models = {name: dict(status) for name, status in _status.items()}
+    ready = bool(models) and all(status["state"] == "loaded" for status in models.values())
+    return {"ready": ready, "models": models, "model_cache": model_manager.stats()}
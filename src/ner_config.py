@@ -5,6 +5,8 @@ This module contains all configuration settings, model names, and constants
 used by the NER extraction system.
 """
 
+import os
+
 # Model Configuration
 NER_MODELS = {
     'spacy': {
@@ -14,10 +16,39 @@ NER_MODELS = {
     },
     'title_extraction': {
         'model': 'javdrher/decide-gemma3-270m',
-        'max_new_tokens': 4000
+        # Hard upper bound on generated tokens
+        'max_new_tokens': 4000,
+        # Per document the cap is json_overhead_tokens + min(document tokens, max_title_tokens);
+        # answers still open at the cap are continued up to the document length
+        'max_title_tokens': int(os.getenv("TITLE_MAX_TOKENS", "256")),
+        'json_overhead_tokens': 16,
+        # Reuse the key/value cache of the fixed instruction prefix across documents
+        'prefix_cache': os.getenv("TITLE_PREFIX_CACHE", "true").lower() == "true",
+        # Batched generation (TitleExtractor.extract_batch): documents per batch and
+        # max padded tokens (batch size x (longest prompt + new tokens)) per batch
+        'batch_size': int(os.getenv("TITLE_BATCH_SIZE", "8")),
+        'batch_token_budget': int(os.getenv("TITLE_BATCH_TOKEN_BUDGET", "8192")),
     }
 }
 
+# spaCy pipeline profiles: components excluded when loading a pipeline.
+# We only read doc.ents, so the "ner" profile drops everything the entity
+# recognizer does not need (tok2vec/transformer are kept, ner may listen to them).
+SPACY_PROFILES = {
+    'full': [],
+    'ner': ['parser', 'tagger', 'morphologizer', 'attribute_ruler', 'lemmatizer',
+            'trainable_lemmatizer', 'senter', 'sentencizer'],
+}
+SPACY_PROFILE = os.getenv("SPACY_PROFILE", "ner")
+
+# Memory budget for models cached by ModelManager, in MB (0 = unlimited).
+# Least recently used models are unloaded when the estimated total exceeds it.
+MODEL_MEMORY_BUDGET_MB = int(os.getenv("MODEL_MEMORY_BUDGET_MB", "0"))
+
+# Dynamic INT8 quantization of Linear layers at load time (CPU), per model kind.
+# Comma-separated: geo (location model), spacy, flair, title, or all
+QUANTIZE_MODELS = {m.strip() for m in os.getenv("NER_QUANTIZE", "").split(",") if m.strip()}
+
 # Language-specific regex patterns organized by pattern type
 # This structure allows easy extension: just add new pattern types like 'person', 'address', etc.
 REGEX_PATTERNS = {
@@ -64,5 +95,49 @@ DEFAULT_SETTINGS = {
     'method': 'regex',
     'deduplicate': True,
     'min_confidence': 0.5,
-    'max_entities': 1000
+    'max_entities': 1000,
+    # Texts longer than this are split into overlapping windows (0 disables chunking)
+    'chunk_chars': int(os.getenv("NER_CHUNK_CHARS", "2000")),
+    'chunk_overlap': int(os.getenv("NER_CHUNK_OVERLAP", "200")),
+}
+
+# Belgian location model (SpacyGeoAnalyzer) inference settings
+GEO_NER_SETTINGS = {
+    # Texts per nlp.pipe batch
+    'batch_size': int(os.getenv("NER_BATCH_SIZE", "8")),
+    # Collect texts from concurrent tasks for up to this many ms (0 disables micro-batching)
+    'batch_wait_ms': float(os.getenv("NER_BATCH_WAIT_MS", "5")),
+    # Sliding windows for long documents
+    'chunk_chars': DEFAULT_SETTINGS['chunk_chars'],
+    'chunk_overlap': DEFAULT_SETTINGS['chunk_overlap'],
+    # Run the transformer with ONNX Runtime (model exported with `python -m src.onnx_backend export`)
+    'onnx_path': os.getenv("NER_ONNX_PATH") or None,
+    'onnx_threads': int(os.getenv("NER_ONNX_THREADS", "0")),
+    # Persist produced Docs (DocBin) in the NER cache (NER_CACHE_PATH) so re-geocoding
+    # skips inference; keys include the model version, so by default entries do not expire
+    'doc_cache': os.getenv("NER_DOC_CACHE", "true").lower() == "true",
+    'doc_cache_ttl': float(os.getenv("NER_DOC_CACHE_TTL")) if os.getenv("NER_DOC_CACHE_TTL") else None,
+    'doc_cache_max_entries': int(os.getenv("NER_DOC_CACHE_MAX_ENTRIES", "200000")),
+}
+
+# NER worker processes (ner_workers.NerWorkerPool)
+NER_WORKER_SETTINGS = {
+    # Number of worker processes (0 runs inference in the web process)
+    'workers': int(os.getenv("NER_WORKERS", "0")),
+    # torch threads per worker; keep workers * threads <= CPU cores
+    'torch_threads': int(os.getenv("NER_WORKER_TORCH_THREADS", "1")),
+    # Workers are started clean so no model or thread state is forked
+    'start_method': os.getenv("NER_WORKER_START_METHOD", "forkserver"),
+}
+
+# Models loaded in the background at service startup, besides the location model.
+# Comma-separated: "spacy:<language>", "flair:<model name>" or "title"
+WARMUP_MODELS = [m.strip() for m in os.getenv("NER_WARMUP_MODELS", "").split(",") if m.strip()]
+
+# Persistent cache of NER results, keyed on text hash, language, method and
+# model version (disabled when no path is set)
+NER_CACHE_SETTINGS = {
+    'path': os.getenv("NER_CACHE_PATH"),
+    'ttl': float(os.getenv("NER_CACHE_TTL", str(90 * 24 * 3600))),
+    'max_entries': int(os.getenv("NER_CACHE_MAX_ENTRIES", "100000")),
 }
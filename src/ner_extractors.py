@@ -7,16 +7,68 @@ Classes:
 - SpacyGeoAnalyzer: Belgian location extraction (returns spaCy Doc)
 - BaseExtractor: Base class for factory pattern extractors (returns dicts)
 - SpacyExtractor, FlairExtractor, etc.: Factory pattern implementations
+
+spaCy, Flair and transformers are imported on first use, so importing this
+module (and the task modules that use it) stays fast.
 """
 import os
 import re
 import json
+import hashlib
 import logging
-import spacy
-from flair.data import Sentence
-from typing import List, Dict, Any
-from .ner_models import model_manager
-from .ner_config import REGEX_PATTERNS, DEFAULT_SETTINGS, TITLE_EXTRACTION_INSTRUCTION, NER_MODELS
+import threading
+from importlib import metadata
+from typing import List, Dict, Any, Optional
+from .ner_models import model_manager, load_spacy_pipeline
+from .quantization import quantization_enabled, quantize_model
+from .onnx_backend import use_onnx_backend
+from .micro_batcher import MicroBatcher
+from .ner_workers import record_to_doc
+from .text_chunking import chunk_text, merge_chunk_entities
+from .ner_config import REGEX_PATTERNS, DEFAULT_SETTINGS, NER_MODELS, TITLE_EXTRACTION_INSTRUCTION
+
+
+def _package_version(name: str) -> str:
+    """Installed version of a (model) package, or 'unknown'."""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _hub_revision(repo_id: str, filename: str = "config.json", cache_dir: Optional[str] = None) -> str:
+    """
+    Commit hash of the locally cached snapshot of a Hugging Face Hub model.
+
+    Local model directories are identified by their path; 'unknown' if the
+    model has not been downloaded yet.
+    """
+    if os.path.isdir(repo_id):
+        return os.path.realpath(repo_id)
+    try:
+        from huggingface_hub import try_to_load_from_cache
+    except ImportError:
+        return "unknown"
+    path = try_to_load_from_cache(repo_id, filename, cache_dir=cache_dir)
+    if not isinstance(path, str):
+        return "unknown"
+    # <cache>/models--<org>--<name>/snapshots/<commit>/<filename>
+    return os.path.basename(os.path.dirname(path))
+
+
+def _flair_cache_dir(model_name: str) -> str:
+    """Directory Flair downloads a Hub model to (flair.cache_root/models/<name>), without importing flair."""
+    cache_root = os.getenv("FLAIR_CACHE_ROOT", os.path.join(os.path.expanduser("~"), ".flair"))
+    return os.path.join(cache_root, "models", model_name.split("/", maxsplit=1)[-1])
+
+
+# The "title" string of a (possibly truncated) JSON answer
+_TITLE_VALUE = re.compile(r'"title"\s*:\s*"((?:[^"\\]|\\.)*)', re.DOTALL)
+
+
+def _fingerprint(value: Any) -> str:
+    """Short stable hash of a JSON-serializable value."""
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()[:12]
 
 
 # ============================================================================
@@ -35,12 +87,80 @@ class SpacyGeoAnalyzer:
     Use SpacyExtractor for: General-purpose NER with dict outputs
     """
     
-    def __init__(self, model_path, labels=None):
+    def __init__(self, model_path, labels=None, batch_size=8, batch_wait_ms=0, worker_pool=None,
+                 chunk_chars=0, chunk_overlap=0, lazy=False, onnx_path=None, onnx_threads=0, doc_cache=None):
+        """
+        Args:
+            model_path: Path to the spaCy model
+            labels: Entity labels of interest (used for logging)
+            batch_size: Number of texts per nlp.pipe batch
+            batch_wait_ms: If > 0, extract_entities() calls from concurrent tasks
+                are collected for up to this many milliseconds and run as one batch
+            worker_pool: Optional NerWorkerPool; inference then runs in its worker
+                processes and the model is not loaded in this process
+            chunk_chars: If > 0, longer texts are processed as overlapping windows of
+                at most this many characters and the entities merged into one Doc
+            chunk_overlap: Overlap between consecutive windows, in characters
+            lazy: Defer loading the model until ensure_loaded() or the first extraction
+            onnx_path: Optional ONNX export of the model's transformer to run with
+                ONNX Runtime instead of PyTorch
+            onnx_threads: ONNX Runtime intra-op threads (0 lets ONNX Runtime decide)
+            doc_cache: Optional DocCache; Docs of texts seen before (with the same
+                model version) are read from it without loading or running the model
+        """
         self.model_path = model_path
         self.labels = set(labels) if labels else None
+        self.batch_size = max(1, batch_size)
+        self.chunk_chars = chunk_chars
+        self.chunk_overlap = chunk_overlap
+        self.onnx_path = onnx_path
+        self.onnx_threads = onnx_threads
+        self.doc_cache = doc_cache
+        self.version = self._model_version()
         self.nlp = None
+        self.worker_pool = worker_pool
         self.logger = logging.getLogger(__name__)
-        self.load_model()
+        self._vocab = None
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        if not lazy:
+            self.ensure_loaded()
+
+        self._batcher = None
+        if batch_wait_ms > 0:
+            self._batcher = MicroBatcher(self.extract_entities_batch, max_batch_size=self.batch_size,
+                                         max_wait=batch_wait_ms / 1000, name="geo-ner-batcher")
+
+    def ensure_loaded(self):
+        """
+        Load the model (or start the worker processes) if that has not happened yet.
+
+        Thread-safe; returns True if entities can be extracted.
+        """
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    if self.worker_pool is None:
+                        self.load_model()
+                        self._loaded = True
+                    else:
+                        # Docs returned by the workers are rebuilt on a local vocab
+                        self._doc_vocab()
+                        # Not ready until every worker has loaded the model; retried on the next call
+                        self._loaded = self.worker_pool.warm_up()
+        return self.ready
+
+    def _model_version(self):
+        """Model name/version (from meta.json, without loading the model) plus settings that affect the Docs."""
+        meta = {}
+        try:
+            with open(os.path.join(self.model_path, "meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, TypeError, ValueError):
+            pass
+        backend = f"onnx={os.path.basename(self.onnx_path)}" if self.onnx_path else f"int8={quantization_enabled('geo')}"
+        return (f"{meta.get('name', 'unknown')}=={meta.get('version', 'unknown')}"
+                f":chunks={self.chunk_chars}/{self.chunk_overlap}:{backend}")
 
     def load_model(self):
         """Load the spaCy NER model from the specified path."""
@@ -48,7 +168,11 @@ class SpacyGeoAnalyzer:
             self.logger.error(f"Model not found at {self.model_path}")
             return
         try:
-            self.nlp = spacy.load(self.model_path)
+            self.nlp = load_spacy_pipeline(self.model_path)
+            if self.onnx_path:
+                use_onnx_backend(self.nlp, self.onnx_path, self.onnx_threads)
+            elif quantization_enabled('geo'):
+                quantize_model(self.nlp)
             self.logger.info(
                 f"Loaded model: {self.nlp.meta.get('name', 'Unknown')} (v{self.nlp.meta.get('version', 'Unknown')})")
             if self.nlp.has_pipe("ner"):
@@ -68,14 +192,95 @@ class SpacyGeoAnalyzer:
         Returns spaCy Doc for compatibility with form_addresses() and form_locations()
         in helper_functions.py which expect entity.label_ and entity.text attributes.
         """
+        if self._batcher is not None and text.strip():
+            return self._batcher.submit(text)
+        return self.extract_entities_batch([text])[0]
+
+    def extract_entities_batch(self, texts):
+        """
+        Extract named entities from several texts with nlp.pipe.
+
+        Returns one result per text, in order, in the same format as
+        extract_entities() (a spaCy Doc, or a dict for empty texts and errors).
+        With a doc cache, cached Docs are returned without running (or loading)
+        the model and only the other texts are processed.
+        """
+        if self.doc_cache is None:
+            return self._extract_uncached(texts)
+
+        results = [None] * len(texts)
+        keys = [self.doc_cache.key(text, self.version) for text in texts]
+        for i, text in enumerate(texts):
+            if text.strip():
+                results[i] = self.doc_cache.get(keys[i], self._doc_vocab())
+        todo = [i for i, result in enumerate(results) if result is None]
+        if todo:
+            for i, result in zip(todo, self._extract_uncached([texts[i] for i in todo])):
+                results[i] = result
+                if not isinstance(result, dict):
+                    self.doc_cache.set(keys[i], result)
+        return results
+
+    def _doc_vocab(self):
+        """Vocab to rehydrate cached Docs on: the model's if it is loaded, else a local one."""
+        if self.nlp is not None:
+            return self.nlp.vocab
+        if self._vocab is None:
+            from spacy.vocab import Vocab
+            self._vocab = Vocab()
+        return self._vocab
+
+    def _extract_uncached(self, texts):
+        """Run the model (here or in the worker pool) over texts."""
+        self.ensure_loaded()
+        if self.worker_pool is not None:
+            return self._extract_in_workers(texts)
         if not self.nlp:
-            return {"error": "Model not loaded"}
-        if not text.strip():
-            return {"entities": [], "text": text}
+            return [{"error": "Model not loaded"} for _ in texts]
+
+        results = [{"entities": [], "text": text} for text in texts]
+        todo = [i for i, text in enumerate(texts) if text.strip()]
+        windows = [(i, offset, chunk) for i in todo
+                   for offset, chunk in chunk_text(texts[i], self.chunk_chars, self.chunk_overlap)]
+        try:
+            docs = self.nlp.pipe((chunk for _, _, chunk in windows), batch_size=self.batch_size)
+            parts = {}
+            for (i, offset, _), doc in zip(windows, docs):
+                parts.setdefault(i, []).append((offset, doc))
+            for i, text_parts in parts.items():
+                results[i] = text_parts[0][1] if len(text_parts) == 1 else self._merge_windows(texts[i], text_parts)
+        except Exception as e:
+            for i in todo:
+                results[i] = {"error": f"Processing error: {e}", "text": texts[i]}
+        return results
+
+    def _merge_windows(self, text, parts):
+        """Build one Doc for text holding the entities of its (offset, window Doc) parts."""
+        from spacy.util import filter_spans
+        doc = self.nlp.make_doc(text)
+        spans = []
+        for offset, part in parts:
+            for ent in part.ents:
+                span = doc.char_span(offset + ent.start_char, offset + ent.end_char, label=ent.label_,
+                                     alignment_mode="expand")
+                if span is not None:
+                    spans.append(span)
+        # Entities in the overlap zones are found twice; keep the longest of overlapping spans
+        doc.ents = filter_spans(spans)
+        return doc
+
+    @property
+    def ready(self):
+        """True if entities can be extracted (model loaded here or in the worker pool)."""
+        return self._loaded and (self.nlp is not None or self.worker_pool is not None)
+
+    def _extract_in_workers(self, texts):
+        """Run extract_entities_batch() in the worker pool and rebuild the Docs locally."""
         try:
-            return self.nlp(text)
+            records = self.worker_pool.geo_entities_batch(texts)
         except Exception as e:
-            return {"error": f"Processing error: {e}", "text": text}
+            return [{"error": f"Processing error: {e}", "text": text} for text in texts]
+        return [record if "words" not in record else record_to_doc(record, self._vocab) for record in records]
 
 
 # ============================================================================
@@ -85,10 +290,26 @@ class SpacyGeoAnalyzer:
 
 class BaseExtractor:
     """Base class for all NER extractors."""
+
+    # Whether long texts may be split into windows by extract_chunked()
+    chunkable = True
     
     def __init__(self, language: str = 'english'):
         self.language = language
         self.settings = DEFAULT_SETTINGS.copy()
+
+    @property
+    def version(self) -> str:
+        """
+        Identifies the model and settings that determine this extractor's output.
+
+        Part of the result cache key, so cached results are not reused after a
+        model, prompt, pattern or chunking change.
+        """
+        version = f"{type(self).__name__}:{self.language}"
+        if self.chunkable:
+            version += f":chunks={self.settings['chunk_chars']}/{self.settings['chunk_overlap']}"
+        return version
     
     def extract(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -101,6 +322,26 @@ class BaseExtractor:
             List of entity dictionaries with keys: text, label, start, end
         """
         raise NotImplementedError
+
+    def extract_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Extract entities from several texts. Subclasses can override this to batch inference."""
+        return [self.extract(text) for text in texts]
+
+    def extract_chunked(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Extract entities from a text of any length.
+
+        Texts longer than settings['chunk_chars'] are split into overlapping
+        windows on sentence/paragraph boundaries, which are run as one
+        extract_batch() call; entity offsets are mapped back to the full text.
+        """
+        if not self.chunkable:
+            return self.extract(text)
+        chunks = chunk_text(text, self.settings['chunk_chars'], self.settings['chunk_overlap'])
+        if len(chunks) == 1:
+            return self.extract(text)
+        results = self.extract_batch([chunk for _, chunk in chunks])
+        return merge_chunk_entities(zip((offset for offset, _ in chunks), results))
     
     def _deduplicate_entities(self, entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove duplicate entities based on span and label."""
@@ -121,28 +362,44 @@ class BaseExtractor:
 
 class SpacyExtractor(BaseExtractor):
     """Extract entities using spaCy models."""
+
+    @property
+    def version(self) -> str:
+        model_name = NER_MODELS['spacy'].get(self.language, '')
+        return (f"{super().version}:{model_name}=={_package_version(model_name)}"
+                f":int8={quantization_enabled('spacy')}")
     
     def extract(self, text: str) -> List[Dict[str, Any]]:
         """Extract entities using spaCy NER."""
         try:
             nlp = model_manager.get_spacy_model(self.language)
             doc = nlp(text)
-            
-            entities = []
-            for ent in doc.ents:
-                entities.append({
-                    'text': ent.text,
-                    'label': ent.label_,
-                    'start': ent.start_char,
-                    'end': ent.end_char
-                })
-            
-            return self._deduplicate_entities(entities)
+            return self._doc_entities(doc)
             
         except Exception as e:
             print(f"Error in spaCy extraction ({self.language}): {e}")
             return []
 
+    def extract_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Extract entities from several texts with nlp.pipe."""
+        try:
+            nlp = model_manager.get_spacy_model(self.language)
+            return [self._doc_entities(doc) for doc in nlp.pipe(texts)]
+        except Exception as e:
+            print(f"Error in spaCy extraction ({self.language}): {e}")
+            return [[] for _ in texts]
+
+    def _doc_entities(self, doc) -> List[Dict[str, Any]]:
+        entities = []
+        for ent in doc.ents:
+            entities.append({
+                'text': ent.text,
+                'label': ent.label_,
+                'start': ent.start_char,
+                'end': ent.end_char
+            })
+        return self._deduplicate_entities(entities)
+
 
 class FlairExtractor(BaseExtractor):
     """Extract entities using Flair models."""
@@ -159,6 +416,11 @@ class FlairExtractor(BaseExtractor):
             'dutch': 'flair/ner-dutch'
         }
         return model_mapping.get(self.language, 'flair/ner-english')
+
+    @property
+    def version(self) -> str:
+        revision = _hub_revision(self.model_name, "pytorch_model.bin", cache_dir=_flair_cache_dir(self.model_name))
+        return f"{super().version}:{self.model_name}@{revision}:int8={quantization_enabled('flair')}"
     
     def extract(self, text: str) -> List[Dict[str, Any]]:
         """Extract entities using Flair NER."""
@@ -166,115 +428,177 @@ class FlairExtractor(BaseExtractor):
             # Load the Flair SequenceTagger model
             tagger = model_manager.get_flair_model(self.model_name)
             
+            from flair.data import Sentence
+
             # Create sentence (don't use tokenizer for legal texts as recommended)
             sentence = Sentence(text, use_tokenizer=False)
             
             # Predict NER tags using the SequenceTagger
             tagger.predict(sentence)
-            
-            entities = []
-            # Iterate over entities and extract information
-            for entity in sentence.get_spans('ner'):
-                entities.append({
-                    'text': entity.text,
-                    'label': entity.get_label('ner').value,
-                    'start': entity.start_position,
-                    'end': entity.end_position
-                })
-            
-            return self._deduplicate_entities(entities)
+            return self._sentence_entities(sentence)
             
         except Exception as e:
             print(f"Error in Flair extraction ({self.model_name}): {e}")
             return []
 
+    def extract_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Extract entities from several texts in one SequenceTagger.predict call."""
+        try:
+            from flair.data import Sentence
+            tagger = model_manager.get_flair_model(self.model_name)
+            sentences = [Sentence(text, use_tokenizer=False) for text in texts]
+            tagger.predict(sentences)
+            return [self._sentence_entities(sentence) for sentence in sentences]
+        except Exception as e:
+            print(f"Error in Flair extraction ({self.model_name}): {e}")
+            return [[] for _ in texts]
+
+    def _sentence_entities(self, sentence) -> List[Dict[str, Any]]:
+        entities = []
+        # Iterate over entities and extract information
+        for entity in sentence.get_spans('ner'):
+            entities.append({
+                'text': entity.text,
+                'label': entity.get_label('ner').value,
+                'start': entity.start_position,
+                'end': entity.end_position
+            })
+        return self._deduplicate_entities(entities)
+
 
 class TitleExtractor(BaseExtractor):
     """Extract document title using Hugging Face Gemma model."""
+
+    # The title is generated from the document as a whole
+    chunkable = False
     
     def __init__(self, language: str = 'dutch'):
         super().__init__(language)
+        self.logger = logging.getLogger(__name__)
+        # Token counts and timing of the last generation
+        self.last_generation: Dict[str, Any] = {}
+
+    @property
+    def version(self) -> str:
+        settings = NER_MODELS['title_extraction']
+        prompt = _fingerprint([TITLE_EXTRACTION_INSTRUCTION, settings['max_title_tokens']])
+        revision = _hub_revision(settings['model'])
+        return f"{super().version}:{settings['model']}@{revision}:{prompt}:int8={quantization_enabled('title')}"
     
     def extract(self, text: str) -> List[Dict[str, Any]]:
         """
         Extract title from text using Gemma model.
         
+        Generation stops as soon as the JSON answer is closed and is capped
+        relative to the document length (see title_generation).
         Returns a single entity with label 'TITLE'.
         """
         try:
+            from .title_generation import generate_title
+
             # Load the title extraction pipeline
             generator = model_manager.get_title_extraction_model()
             
-            # Prepare the prompt combining instruction and text
-            prompt = f"{TITLE_EXTRACTION_INSTRUCTION}\n\nText:\n{text}"
-            
-            # Create conversation format matching HuggingFace example
-            conversation = [{"role": "user", "content": prompt}]
-            
-            # Generate the title (matching HF example format)
-            max_tokens = NER_MODELS['title_extraction']['max_new_tokens']
-            output = generator(
-                conversation, 
-                max_new_tokens=max_tokens, 
-                return_full_text=False
-            )[0]
-            
-            # Parse the generated text to extract JSON
-            generated_text = output['generated_text']
-            
-            # Try to extract JSON from the response
-            try:
-                # Look for JSON in the response
-                if '{' in generated_text and '}' in generated_text:
-                    start_idx = generated_text.find('{')
-                    end_idx = generated_text.rfind('}') + 1
-                    json_str = generated_text[start_idx:end_idx]
-                    result = json.loads(json_str)
-                    title = result.get('title', '').strip()
-                else:
-                    # Fallback: treat whole response as title
-                    title = generated_text.strip()
-            except json.JSONDecodeError:
-                # If JSON parsing fails, use the whole response
-                title = generated_text.strip()
+            # Generate the JSON answer
+            generated_text, self.last_generation = generate_title(generator, text)
+            self.logger.info(
+                f"Title generation: {self.last_generation['generated_tokens']} tokens "
+                f"(cap {self.last_generation['max_new_tokens']}) in {self.last_generation['seconds']}s")
             
-            if title:
-                # Try to find the title in the original text
-                start_pos = text.find(title)
-                if start_pos != -1:
-                    # Title found in original text
-                    entities = [{
-                        'text': title,
-                        'label': 'TITLE',
-                        'start': start_pos,
-                        'end': start_pos + len(title)
-                    }]
-                else:
-                    # Title generated/extracted but not exact match in text
-                    # Set start=0, end=0 to indicate it's a generated/inferred title
-                    entities = [{
-                        'text': title,
-                        'label': 'TITLE',
-                        'start': 0,
-                        'end': 0
-                    }]
-                return entities
+            return self._title_entities(text, self._parse_title(generated_text))
             
+        except Exception as e:
+            print(f"Error in title extraction: {e}")
             return []
-            
+
+    def extract_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Extract the titles of many documents (e.g. backfills).
+
+        Documents are grouped by prompt length and generated as padded batches
+        within a token budget; results are returned in input order.
+        """
+        try:
+            from .title_generation import generate_titles
+
+            generator = model_manager.get_title_extraction_model()
+            results, generated_tokens = [], 0
+            for text, (generated_text, stats) in zip(texts, generate_titles(generator, texts)):
+                results.append(self._title_entities(text, self._parse_title(generated_text)))
+                generated_tokens += stats['generated_tokens']
+            self.logger.info(f"Generated {len(texts)} titles in batches ({generated_tokens} tokens)")
+            return results
+
         except Exception as e:
             print(f"Error in title extraction: {e}")
+            return [[] for _ in texts]
+
+    @staticmethod
+    def _parse_title(generated_text: str) -> str:
+        """Get the title from the generated JSON answer."""
+        # Try to extract JSON from the response
+        try:
+            # Look for JSON in the response
+            if '{' in generated_text and '}' in generated_text:
+                start_idx = generated_text.find('{')
+                end_idx = generated_text.rfind('}') + 1
+                json_str = generated_text[start_idx:end_idx]
+                result = json.loads(json_str)
+                return str(result.get('title', '')).strip()
+        except json.JSONDecodeError:
+            pass
+        if '{' not in generated_text:
+            # Fallback: treat whole response as title
+            return generated_text.strip()
+        # Truncated or malformed JSON: take the (possibly unterminated) title string
+        match = _TITLE_VALUE.search(generated_text)
+        if match is None:
+            return ''
+        try:
+            return json.loads(f'"{match.group(1)}"').strip()
+        except json.JSONDecodeError:
+            return match.group(1).strip()
+
+    @staticmethod
+    def _title_entities(text: str, title: str) -> List[Dict[str, Any]]:
+        """Build the TITLE entity for a title of text."""
+        if not title:
             return []
+        # Try to find the title in the original text
+        start_pos = text.find(title)
+        if start_pos != -1:
+            # Title found in original text
+            return [{
+                'text': title,
+                'label': 'TITLE',
+                'start': start_pos,
+                'end': start_pos + len(title)
+            }]
+        # Title generated/extracted but not exact match in text
+        # Set start=0, end=0 to indicate it's a generated/inferred title
+        return [{
+            'text': title,
+            'label': 'TITLE',
+            'start': 0,
+            'end': 0
+        }]
 
 
 class RegexExtractor(BaseExtractor):
     """Extract entities using regex patterns."""
+
+    # Regexes scan the full text in linear time; windows would only split matches
+    chunkable = False
     
     def __init__(self, language: str = 'english', patterns: Dict[str, List[str]] = None):
         super().__init__(language)
         self.patterns = patterns or {}
         self._compiled_patterns = {}
         self._compile_patterns()
+
+    @property
+    def version(self) -> str:
+        return f"{super().version}:{_fingerprint(self.patterns)}"
     
     def _compile_patterns(self):
         """Compile regex patterns for better performance."""
@@ -323,6 +647,10 @@ class CompositeExtractor(BaseExtractor):
     def __init__(self, extractors: List[BaseExtractor]):
         super().__init__()
         self.extractors = extractors
+
+    @property
+    def version(self) -> str:
+        return "+".join(extractor.version for extractor in self.extractors)
     
     def extract(self, text: str) -> List[Dict[str, Any]]:
         """Extract entities using all configured extractors."""
@@ -338,6 +666,19 @@ class CompositeExtractor(BaseExtractor):
         
         return self._deduplicate_entities(all_entities)
 
+    def extract_chunked(self, text: str) -> List[Dict[str, Any]]:
+        """Extract entities using all configured extractors, each chunking long texts as needed."""
+        all_entities = []
+
+        for extractor in self.extractors:
+            try:
+                all_entities.extend(extractor.extract_chunked(text))
+            except Exception as e:
+                print(f"Error in extractor {type(extractor).__name__}: {e}")
+                continue
+
+        return self._deduplicate_entities(all_entities)
+
 
 # Pre-configured extractors for common use cases
 def create_german_extractor() -> CompositeExtractor:
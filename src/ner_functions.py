@@ -18,6 +18,8 @@ from .ner_extractors import (
     TitleExtractor,
     CompositeExtractor
 )
+from .ner_workers import get_worker_pool
+from .ner_result_cache import get_result_cache
 
 
 def get_composite_extractor(language: str) -> CompositeExtractor:
@@ -57,6 +59,27 @@ def get_extractor(language: str, extractor_type: str = 'composite'):
         return extractor(language)
     raise ValueError(f"Unsupported combination: {language} + {extractor_type}")
 
+def get_method_extractor(language: str, method: str):
+    """Get the cached extractor for an extraction method, validating the method."""
+    if method == 'composite':
+        return get_extractor(language, 'composite')
+    elif method == 'spacy':
+        return get_extractor(language, 'spacy')
+    elif method == 'flair':
+        return get_extractor(language, 'flair')
+    elif method == 'regex':
+        return get_extractor(language, 'regex')
+    elif method == 'title':
+        return get_extractor(language, 'title')
+    else:
+        raise ValueError(f"Unsupported method '{method}' for language '{language}'")
+
+
+def extract_entities_local(text: str, language: str, method: str) -> List[Dict[str, Any]]:
+    """Run the extraction in this process, without the result cache (used by the NER workers)."""
+    return get_method_extractor(language, method).extract_chunked(text)
+
+
 # New simplified interface
 def extract_entities(text: str, language: str = 'german', method: str = 'composite') -> List[Dict[str, Any]]:
     """
@@ -76,18 +99,59 @@ def extract_entities(text: str, language: str = 'german', method: str = 'composi
         entities = extract_entities("Herr W. verstieß gegen § 36 Abs. 7 IfSG.", 'german', 'flair')
         # For title extraction:
         entities = extract_entities(document_text, 'dutch', 'title')
+
+    Long texts are split into overlapping windows (NER_CHUNK_CHARS); with
+    NER_WORKERS > 0 the extraction runs in a NER worker process. With
+    NER_CACHE_PATH set, results for an unchanged text, language, method and
+    model version are served from the result cache.
     """
-    if method == 'composite':
-        extractor = get_extractor(language, 'composite')
-    elif method == 'spacy':
-        extractor = get_extractor(language, 'spacy')
-    elif method == 'flair':
-        extractor = get_extractor(language, 'flair')
-    elif method == 'regex':
-        extractor = get_extractor(language, 'regex')
-    elif method == 'title':
-        extractor = get_extractor(language, 'title')
+    extractor = get_method_extractor(language, method)
+
+    cache = get_result_cache()
+    key = cache.key(text, language, method, extractor.version) if cache is not None else None
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    pool = get_worker_pool()
+    if pool is not None:
+        entities = pool.extract_entities(text, language, method)
     else:
-        raise ValueError(f"Unsupported method '{method}' for language '{language}'")
-    
-    return extractor.extract(text)
+        entities = extractor.extract_chunked(text)
+
+    # Extractors return [] when they fail, so empty results are not cached. The
+    # key is rebuilt because the model revision is only known once it is downloaded.
+    if key is not None and entities:
+        cache.set(cache.key(text, language, method, extractor.version), entities)
+    return entities
+
+
+def extract_entities_batch(texts: List[str], language: str = 'german', method: str = 'composite') -> List[List[Dict[str, Any]]]:
+    """
+    Extract entities from many texts, e.g. for backfills.
+
+    Titles ('title' method) are generated in padded batches of similar length;
+    the other methods process the texts one by one like extract_entities().
+
+    Returns:
+        One list of entity dictionaries per text, in input order
+    """
+    if method != 'title':
+        return [extract_entities(text, language=language, method=method) for text in texts]
+
+    extractor = get_method_extractor(language, method)
+    cache = get_result_cache()
+    if cache is None:
+        return extractor.extract_batch(texts)
+
+    keys = [cache.key(text, language, method, extractor.version) for text in texts]
+    results = [cache.get(key) for key in keys]
+    todo = [i for i, result in enumerate(results) if result is None]
+    batch_results = extractor.extract_batch([texts[i] for i in todo])
+    version = extractor.version
+    for i, entities in zip(todo, batch_results):
+        results[i] = entities
+        if entities:
+            cache.set(cache.key(texts[i], language, method, version), entities)
+    return results
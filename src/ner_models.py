@@ -2,14 +2,97 @@
 NER Model Management
 
 This module handles loading and caching of NER models with lazy initialization.
+spaCy, Flair and transformers are only imported when a model is first loaded.
+Cached models are kept within a memory budget (MODEL_MEMORY_BUDGET_MB) by
+unloading the least recently used ones.
 """
 
-import spacy
-from typing import Dict, Any
-from transformers import pipeline
-from .ner_config import NER_MODELS
-from flair.models import SequenceTagger
-from transformers import AutoTokenizer, AutoModelForCausalLM
+import gc
+import logging
+import resource
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional, Tuple
+from .ner_config import NER_MODELS, SPACY_PROFILES, SPACY_PROFILE, MODEL_MEMORY_BUDGET_MB
+from .quantization import quantization_enabled, quantize_model
+
+logger = logging.getLogger(__name__)
+
+
+def load_spacy_pipeline(name: str, profile: Optional[str] = None):
+    """
+    Load a spaCy pipeline with the components of a profile excluded.
+
+    Args:
+        name: Package name or path of the pipeline
+        profile: Key of SPACY_PROFILES (defaults to SPACY_PROFILE)
+
+    Returns:
+        Loaded spaCy Language object
+    """
+    import spacy
+
+    profile = profile or SPACY_PROFILE
+    if profile not in SPACY_PROFILES:
+        raise ValueError(f"Unknown spaCy profile: {profile}")
+    start = time.perf_counter()
+    nlp = spacy.load(name, exclude=SPACY_PROFILES[profile])
+    logger.info(f"Loaded spaCy pipeline {name} ({profile} profile, components: {nlp.pipe_names}) "
+                f"in {time.perf_counter() - start:.2f}s")
+    return nlp
+
+
+def _rss_bytes() -> int:
+    """Resident set size of this process (Linux), 0 if unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _torch_bytes(module: Any) -> int:
+    """Size of the parameters and buffers of a torch module, including INT8-quantized Linear weights."""
+    tensors = list(module.parameters()) + list(module.buffers())
+    for submodule in module.modules():
+        # Dynamically quantized Linear layers keep their weights in packed params
+        if hasattr(submodule, "_weight_bias"):
+            tensors.extend(t for t in submodule._weight_bias() if t is not None)
+    return sum(t.numel() * t.element_size() for t in tensors)
+
+
+def _thinc_bytes(model: Any) -> int:
+    """Size of the parameters of a thinc model, including wrapped torch models."""
+    size = 0
+    for node in model.walk():
+        for name in node.param_names:
+            if node.has_param(name):
+                size += node.get_param(name).nbytes
+        for shim in node.shims:
+            if hasattr(getattr(shim, "_model", None), "parameters"):
+                size += _torch_bytes(shim._model)
+    return size
+
+
+def estimate_model_bytes(model: Any) -> int:
+    """
+    Estimate the memory held by a model's weights.
+
+    Handles torch modules (Flair), Hugging Face pipelines and spaCy pipelines
+    (thinc weights plus torch models behind PyTorch shims). Returns 0 if the
+    model type is not recognized.
+    """
+    try:
+        if hasattr(model, "parameters") and hasattr(model, "buffers"):
+            return _torch_bytes(model)
+        if hasattr(getattr(model, "model", None), "parameters"):
+            return _torch_bytes(model.model)
+        if hasattr(model, "pipeline"):
+            return sum(_thinc_bytes(proc.model) for _, proc in model.pipeline if hasattr(proc, "model"))
+    except Exception as e:
+        logger.warning(f"Could not estimate model size: {e}")
+    return 0
 
 
 class ModelManager:
@@ -17,16 +100,81 @@ class ModelManager:
     Singleton class to manage NER model loading and caching.
     
     This class ensures models are loaded only once and cached for reuse,
-    improving performance and memory usage.
+    improving performance and memory usage. Concurrent first loads of the same
+    model wait for a single load (per-model lock), and when the estimated size
+    of the cached models exceeds the memory budget the least recently used
+    models are unloaded.
     """
     
     _instance = None
-    _models: Dict[str, Any] = {}
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._init(MODEL_MEMORY_BUDGET_MB * 1024 * 1024)
         return cls._instance
+
+    def _init(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        # model_key -> (model, estimated bytes), least recently used first
+        self._models: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+
+    def _get(self, model_key: str, loader: Callable[[], Any]) -> Any:
+        """Return a cached model, or load it (once, even with concurrent callers) and cache it."""
+        with self._lock:
+            entry = self._models.get(model_key)
+            if entry is not None:
+                self._models.move_to_end(model_key)
+                self.hits += 1
+                return entry[0]
+            key_lock = self._key_locks.setdefault(model_key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                entry = self._models.get(model_key)
+                if entry is not None:
+                    self._models.move_to_end(model_key)
+                    self.hits += 1
+                    return entry[0]
+
+            rss_before = _rss_bytes()
+            start = time.perf_counter()
+            model = loader()
+            # Weights are counted exactly where possible; the RSS growth during the
+            # load is only a fallback as concurrent loads of other models inflate it
+            size = estimate_model_bytes(model) or max(0, _rss_bytes() - rss_before)
+            logger.info(f"Loaded {model_key} (~{size / 1024 / 1024:.0f} MB) in {time.perf_counter() - start:.2f}s")
+
+            with self._lock:
+                self._models[model_key] = (model, size)
+                self.loads += 1
+                evicted = self._evict(keep=model_key)
+        if evicted:
+            gc.collect()
+        return model
+
+    def _evict(self, keep: str) -> int:
+        """Unload least recently used models (never `keep`) until within budget. Caller holds _lock."""
+        evicted = 0
+        while self.budget_bytes > 0 and self.resident_bytes > self.budget_bytes:
+            victim = next((key for key in self._models if key != keep), None)
+            if victim is None:
+                break
+            _, size = self._models.pop(victim)
+            self.evictions += 1
+            evicted += 1
+            logger.info(f"Unloaded {victim} (~{size / 1024 / 1024:.0f} MB) to stay within the model memory budget")
+        return evicted
+
+    @property
+    def resident_bytes(self) -> int:
+        """Estimated size of all cached models."""
+        return sum(size for _, size in self._models.values())
     
     def get_spacy_model(self, language: str):
         """
@@ -47,17 +195,20 @@ class ModelManager:
         
         model_key = f"spacy_{language}"
         
-        if model_key not in self._models:
+        def load():
             model_name = NER_MODELS['spacy'][language]
             try:
-                self._models[model_key] = spacy.load(model_name)
+                nlp = load_spacy_pipeline(model_name)
             except OSError:
                 raise Exception(
                     f"spaCy model '{model_name}' not found. "
                     f"Please install with: python -m spacy download {model_name}"
                 )
+            if quantization_enabled('spacy'):
+                quantize_model(nlp)
+            return nlp
         
-        return self._models[model_key]
+        return self._get(model_key, load)
     
     def get_flair_model(self, model_name: str):
         """
@@ -74,17 +225,21 @@ class ModelManager:
         """
         model_key = f"flair_{model_name.replace('/', '_')}"
         
-        if model_key not in self._models:
+        def load():
             try:
-                self._models[model_key] = SequenceTagger.load(model_name)
+                from flair.models import SequenceTagger
+                tagger = SequenceTagger.load(model_name)
             except Exception as e:
                 raise Exception(
                     f"Flair model '{model_name}' not found. "
                     f"Please install with: pip install flair. "
                     f"Error: {str(e)}"
                 )
+            if quantization_enabled('flair'):
+                quantize_model(tagger)
+            return tagger
         
-        return self._models[model_key]
+        return self._get(model_key, load)
     
     def get_title_extraction_model(self):
         """
@@ -98,8 +253,9 @@ class ModelManager:
         """
         model_key = "title_extraction_pipeline"
         
-        if model_key not in self._models:
+        def load():
             try:                
+                from transformers import AutoTokenizer, AutoModelForCausalLM, pipeline
                 model_name = NER_MODELS['title_extraction']['model']
                 
                 # Explicitly load tokenizer and model first
@@ -110,15 +266,22 @@ class ModelManager:
                     trust_remote_code=True,
                     device_map="cpu"
                 )
+                if quantization_enabled('title'):
+                    quantize_model(model)
                 
                 # Create pipeline from the loaded model and tokenizer
-                self._models[model_key] = pipeline(
+                generator = pipeline(
                     "text-generation",
                     model=model,
                     tokenizer=tokenizer,
                     device="cpu"
                 )
+                if NER_MODELS['title_extraction']['prefix_cache']:
+                    from .title_generation import PromptPrefixCache
+                    # Instruction prefix shared by every prompt, encoded once
+                    generator.prefix_cache = PromptPrefixCache(model, tokenizer)
                 print(f"Successfully loaded title extraction model")
+                return generator
             except Exception as e:
                 import traceback
                 error_details = traceback.format_exc()
@@ -127,12 +290,28 @@ class ModelManager:
                     f"Error: {str(e)}\n{error_details}"
                 )
         
-        return self._models[model_key]
+        return self._get(model_key, load)
     
     
     def clear_cache(self):
         """Clear all cached models to free memory."""
-        self._models.clear()
+        with self._lock:
+            self._models.clear()
+        gc.collect()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return load/eviction counters and the estimated size of each cached model."""
+        with self._lock:
+            models = {key: round(size / 1024 / 1024, 1) for key, (_, size) in self._models.items()}
+            resident = self.resident_bytes
+        return {
+            "hits": self.hits,
+            "loads": self.loads,
+            "evictions": self.evictions,
+            "resident_mb": round(resident / 1024 / 1024, 1),
+            "budget_mb": self.budget_bytes // 1024 // 1024,
+            "models_mb": models,
+        }
 
 
 # Global model manager instance
@@ -0,0 +1,58 @@
+"""
+NER Result Cache
+
+Persistent cache of extract_entities() results so re-processing a decision
+whose text has not changed (retries, re-notifications, duplicated deltas)
+costs a hash and a lookup instead of a model pass. Keys combine the SHA-256 of
+the text with the language, method and the extractor's model version.
+"""
+
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from .ner_config import NER_CACHE_SETTINGS
+from .sqlite_cache import SqliteCache
+
+
+def text_hash(text: str) -> str:
+    """SHA-256 hex digest of a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class NerResultCache:
+    """Bounded LRU + TTL store of entity lists, backed by `SqliteCache`."""
+
+    def __init__(self, path: str, ttl: Optional[float] = 90 * 24 * 3600, max_entries: int = 100_000):
+        self._store = SqliteCache(path, table="ner_results", max_entries=max_entries, ttl=ttl)
+
+    @staticmethod
+    def key(text: str, language: str, method: str, version: str) -> str:
+        return f"{text_hash(text)}|{language}|{method}|{version}"
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached entities, or None on a miss."""
+        return self._store.get(key)
+
+    def set(self, key: str, entities: List[Dict[str, Any]]) -> None:
+        self._store.set(key, entities)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._store.stats()
+
+
+_cache: Optional[NerResultCache] = None
+
+
+def get_result_cache() -> Optional[NerResultCache]:
+    """Return the shared result cache, or None if NER_CACHE_PATH is not set."""
+    global _cache
+    if _cache is None and NER_CACHE_SETTINGS['path']:
+        _cache = NerResultCache(
+            NER_CACHE_SETTINGS['path'],
+            ttl=NER_CACHE_SETTINGS['ttl'],
+            max_entries=NER_CACHE_SETTINGS['max_entries']
+        )
+    return _cache
@@ -0,0 +1,191 @@
+"""
+NER Worker Processes
+
+Runs CPU-bound NER inference in a pool of worker processes so documents are
+processed in parallel instead of competing with the web server in a single
+process. Each worker loads its models once, in its initializer (after the
+process has started, so nothing model-related is forked), and limits its
+torch thread count so the workers do not oversubscribe the CPU.
+
+Results cross the process boundary as plain records
+({text, label, start, end}); for the location model the tokens are sent along
+so the parent can rebuild a spaCy Doc for process_text().
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .ner_config import GEO_NER_SETTINGS, NER_WORKER_SETTINGS
+
+# Per-process state of a worker (empty in the parent process)
+_worker: Dict[str, Any] = {}
+
+
+def in_worker() -> bool:
+    """True when running inside a NER worker process."""
+    return bool(_worker)
+
+
+def _init_worker(geo_model_path: Optional[str], geo_labels: Optional[List[str]], torch_threads: int,
+                 barrier: Any = None) -> None:
+    """Worker initializer: limit threads and load the location model once."""
+    os.environ["OMP_NUM_THREADS"] = str(torch_threads)
+    os.environ["MKL_NUM_THREADS"] = str(torch_threads)
+    try:
+        import torch
+        torch.set_num_threads(torch_threads)
+    except ImportError:
+        pass
+
+    _worker["pid"] = os.getpid()
+    _worker["barrier"] = barrier
+    if geo_model_path:
+        from .ner_extractors import SpacyGeoAnalyzer
+        _worker["geo"] = SpacyGeoAnalyzer(model_path=geo_model_path, labels=geo_labels,
+                                          batch_size=GEO_NER_SETTINGS["batch_size"],
+                                          chunk_chars=GEO_NER_SETTINGS["chunk_chars"],
+                                          chunk_overlap=GEO_NER_SETTINGS["chunk_overlap"],
+                                          onnx_path=GEO_NER_SETTINGS["onnx_path"],
+                                          onnx_threads=GEO_NER_SETTINGS["onnx_threads"])
+
+
+def doc_to_record(doc: Any) -> Dict[str, Any]:
+    """Convert a spaCy Doc to a plain record with tokens and entities."""
+    return {
+        "text": doc.text,
+        "words": [token.text for token in doc],
+        "spaces": [bool(token.whitespace_) for token in doc],
+        "ents": [
+            {"text": ent.text, "label": ent.label_, "start": ent.start_char, "end": ent.end_char}
+            for ent in doc.ents
+        ],
+    }
+
+
+def record_to_doc(record: Dict[str, Any], vocab: Any) -> Any:
+    """Rebuild a spaCy Doc (tokens and entities) from a record made by doc_to_record()."""
+    from spacy.tokens import Doc
+    doc = Doc(vocab, words=record["words"], spaces=record["spaces"])
+    spans = []
+    for ent in record["ents"]:
+        span = doc.char_span(ent["start"], ent["end"], label=ent["label"], alignment_mode="expand")
+        if span is not None:
+            spans.append(span)
+    doc.ents = spans
+    return doc
+
+
+def _geo_entities_batch(texts: List[str]) -> List[Dict[str, Any]]:
+    """Run the location model in a worker; errors and empty texts are returned as dicts."""
+    analyzer = _worker.get("geo")
+    if analyzer is None:
+        return [{"error": "Model not loaded"} for _ in texts]
+    results = []
+    for result in analyzer.extract_entities_batch(texts):
+        results.append(result if isinstance(result, dict) else doc_to_record(result))
+    return results
+
+
+def _worker_ready(_: Any = None) -> bool:
+    """True if the location model is loaded in this worker."""
+    analyzer = _worker.get("geo")
+    return analyzer is not None and analyzer.ready
+
+
+def _warm_up_worker(timeout: float) -> Dict[str, Any]:
+    """
+    Report this worker's pid and model state once every worker has started.
+
+    Waiting on the barrier keeps this worker busy, so the pool hands each of
+    the warm-up tasks to a different worker process.
+    """
+    try:
+        _worker["barrier"].wait(timeout)
+    except threading.BrokenBarrierError:
+        return {"pid": _worker["pid"], "ready": False, "error": "not all workers started in time"}
+    return {"pid": _worker["pid"], "ready": _worker_ready()}
+
+
+def _general_entities(text: str, language: str, method: str) -> List[Dict[str, Any]]:
+    """Run the extraction of ner_functions.extract_entities in a worker (the parent handles the result cache)."""
+    from .ner_functions import extract_entities_local
+    return extract_entities_local(text, language, method)
+
+
+class NerWorkerPool:
+    """Process pool for location and general NER inference."""
+
+    def __init__(self, workers: int, geo_model_path: Optional[str] = None, geo_labels: Optional[List[str]] = None,
+                 torch_threads: int = 1, start_method: str = "forkserver"):
+        self.workers = max(1, workers)
+        self.logger = logging.getLogger(__name__)
+        context = multiprocessing.get_context(start_method)
+        # Every worker passes this barrier in warm_up(), so each one reports its own model state
+        self._barrier = context.Barrier(self.workers)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(geo_model_path, geo_labels, torch_threads, self._barrier),
+        )
+        self.logger.info(f"Started NER worker pool with {self.workers} workers ({start_method})")
+
+    def geo_entities_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Run the location model over texts, spread evenly over the workers. Returns records in order."""
+        if not texts:
+            return []
+        size = -(-len(texts) // self.workers)
+        chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+        results = []
+        for chunk_result in self._executor.map(_geo_entities_batch, chunks):
+            results.extend(chunk_result)
+        return results
+
+    def warm_up(self, timeout: float = 600.0) -> bool:
+        """
+        Start the worker processes and wait until their models are loaded.
+
+        Returns True only if every worker reports its location model as loaded
+        (the models load in the initializer, before a worker takes a task).
+        """
+        try:
+            reports = list(self._executor.map(_warm_up_worker, [timeout] * self.workers))
+        except Exception as e:
+            self.logger.error(f"NER worker warm-up failed: {e}")
+            return False
+        failed = [report for report in reports if not report["ready"]]
+        for report in failed:
+            self.logger.error(f"NER worker {report['pid']} is not ready: {report.get('error', 'model not loaded')}")
+        return not failed and len({report["pid"] for report in reports}) == self.workers
+
+    def extract_entities(self, text: str, language: str, method: str) -> List[Dict[str, Any]]:
+        """Run ner_functions.extract_entities in a worker process."""
+        return self._executor.submit(_general_entities, text, language, method).result()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool: Optional[NerWorkerPool] = None
+
+
+def get_worker_pool() -> Optional[NerWorkerPool]:
+    """Return the shared worker pool if NER_WORKERS > 0 (never inside a worker itself)."""
+    global _pool
+    if NER_WORKER_SETTINGS['workers'] <= 0 or in_worker():
+        return None
+    if _pool is None:
+        labels = os.getenv("NER_LABELS")
+        _pool = NerWorkerPool(
+            workers=NER_WORKER_SETTINGS['workers'],
+            geo_model_path=os.getenv("NER_MODEL_PATH"),
+            geo_labels=json.loads(labels) if labels else None,
+            torch_threads=NER_WORKER_SETTINGS['torch_threads'],
+            start_method=NER_WORKER_SETTINGS['start_method'],
+        )
+    return _pool
@@ -1,21 +1,43 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import requests
 import time
 import logging
 
+from .geocode_cache import GeocodeCache, cache_key
+from .gazetteer import StreetGazetteer
+from .geometry import GEOMETRY_MODES, apply_geometry_mode
+from .single_flight import SingleFlight
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+
 
 class NominatimGeocoder:
     """Geocoder client for Nominatim OpenStreetMap geocoding service."""
     
-    def __init__(self, base_url: str = "http://localhost:8080", rate_limit: float = 1.0, timeout: float = 10.0):
+    def __init__(self, base_url: str = "http://localhost:8080", rate_limit: float = 1.0, timeout: float = 10.0,
+                 cache: Optional[GeocodeCache] = None,
+                 gazetteer: Optional[StreetGazetteer] = None, breaker: Optional[CircuitBreaker] = None):
         self.base_url = base_url.rstrip("/")
         self.rate_limit = max(0.0, rate_limit)
         self.timeout = timeout
+        self.cache = cache
+        self.gazetteer = gazetteer
+        self.breaker = breaker or CircuitBreaker(max_concurrency=1)
         self._last = 0.0
         self._sess = requests.Session()
+        self._flights = SingleFlight()
 
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def available(self) -> bool:
+        """False while the circuit breaker is open and requests fail fast."""
+        return not self.breaker.is_open
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the circuit breaker admits requests again."""
+        return self.breaker.retry_after
+
     def _throttle(self) -> None:
         """Enforce rate limiting between API requests."""
         now = time.monotonic()
@@ -24,12 +46,91 @@ class NominatimGeocoder:
             time.sleep(wait)
         self._last = time.monotonic()
 
-    def search(self, query: str, city: str = "Gent", limit: int = 1, country: str = "BE") -> Optional[Dict[str, Any]]:
-        """Search for a location and return geocoded result with coordinates."""
+    def search(self, query: str, city: str = "Gent", limit: int = 1, country: str = "BE",
+               geometry: str = "full", tolerance: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Search for a location and return geocoded result with coordinates.
+
+        `geometry` controls the returned `geojson`: "full" (Nominatim's
+        geometry), "simplified" (simplified by Nominatim with `tolerance` in
+        degrees), "centroid" (a Point) or "none".
+        """
         if not query or not query.strip():
             return None
+        if geometry not in GEOMETRY_MODES:
+            raise ValueError(f"Unsupported geometry mode: {geometry}")
+
+        if self.gazetteer is not None:
+            result = self.gazetteer.search(query, city=city)
+            if result is not None:
+                return apply_geometry_mode(result, geometry, tolerance)
+
+        key = cache_key(query, city, country, limit, geometry, tolerance)
+        if self.cache is not None:
+            found, cached = self.cache.lookup(key)
+            if found:
+                return {**cached, "query": query} if cached is not None else None
+
+        result = self._flights.do(key, lambda: self._lookup(key, query, city, limit, country, geometry, tolerance))
+        if result is not None and result["query"] != query:
+            result = {**result, "query": query}
+        return result
+
+    def _lookup(self, key: str, query: str, city: str, limit: int, country: str,
+                geometry: str, tolerance: Optional[float]) -> Optional[Dict[str, Any]]:
+        """Fetch and format a result from Nominatim and store it in the cache."""
+        try:
+            results = self._fetch(query, city, limit, country, geometry, tolerance)
+        except CircuitOpenError as exc:
+            self.logger.debug("Skipping Nominatim request for %r: %s", query, exc)
+            return None
+        except requests.RequestException as exc:
+            self.logger.warning(
+                "Nominatim request failed for %r: %s", query, exc)
+            return None
+        except ValueError as exc:
+            self.logger.warning(
+                "Failed parsing Nominatim JSON for %r: %s", query, exc)
+            return None
+
+        if not results:
+            if self.cache is not None:
+                self.cache.set_negative(key)
+            return None
 
+        result = apply_geometry_mode(
+            self._format(results[0], original_query=query), geometry, tolerance, simplify_locally=False)
+        if self.cache is not None:
+            self.cache.set(key, result)
+        return result
+
+    def _fetch(self, query: str, city: str, limit: int, country: str,
+               geometry: str = "full", tolerance: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Query the Nominatim API, respecting the rate limit and circuit breaker, and return the raw results."""
+        self.breaker.before_call()
         self._throttle()
+        start = time.monotonic()
+        try:
+            resp = self._sess.get(
+                f"{self.base_url}/search", params=self._params(query, city, limit, country, geometry, tolerance), timeout=self.timeout)
+            resp.raise_for_status()
+            results = resp.json()
+        except requests.HTTPError as exc:
+            # Client errors are the request's fault, not the backend's
+            if exc.response is not None and exc.response.status_code < 500:
+                self.breaker.record_success(time.monotonic() - start)
+            else:
+                self.breaker.record_failure()
+            raise
+        except (requests.RequestException, ValueError):
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success(time.monotonic() - start)
+        return results
+
+    def _params(self, query: str, city: str, limit: int, country: str,
+                geometry: str = "full", tolerance: Optional[float] = None) -> Dict[str, Any]:
+        """Build the query parameters for a Nominatim search request."""
         full_query = f"{query}, {city}" if city else query
         params = {
             "q": full_query,
@@ -39,25 +140,13 @@ class NominatimGeocoder:
             "addressdetails": 1,
             "extratags": 0,
             "namedetails": 0,
-            "polygon_geojson": 1
         }
-
-        try:
-            resp = self._sess.get(
-                f"{self.base_url}/search", params=params, timeout=self.timeout)
-            resp.raise_for_status()
-            results = resp.json()
-            if not results:
-                return None
-            return self._format(results[0], original_query=query)
-        except requests.RequestException as exc:
-            self.logger.warning(
-                "Nominatim request failed for %r: %s", query, exc)
-            return None
-        except ValueError as exc:
-            self.logger.warning(
-                "Failed parsing Nominatim JSON for %r: %s", query, exc)
-            return None
+        # Only request polygons when the caller needs the geometry
+        if geometry in ("full", "simplified"):
+            params["polygon_geojson"] = 1
+            if geometry == "simplified" and tolerance:
+                params["polygon_threshold"] = tolerance
+        return params
 
     def _format(self, r: Dict[str, Any], original_query: str) -> Dict[str, Any]:
         addr = r.get("address", {})
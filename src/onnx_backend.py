@@ -0,0 +1,188 @@
+"""
+ONNX Runtime Backend for the Location Model
+
+Exports the transformer of a spacy-transformers pipeline (the RoBERTa
+location model) to ONNX and runs it with ONNX Runtime instead of PyTorch.
+The exported model replaces the Hugging Face model inside the pipeline's
+transformer shim, so tokenization, the NER head and the resulting Doc
+entities are unchanged.
+
+Export (optionally with INT8 weights) with:
+
+    python -m src.onnx_backend export $NER_MODEL_PATH geo-ner.onnx --quantize
+
+and set NER_ONNX_PATH to the written file.
+"""
+
+import argparse
+import logging
+import os
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Sentences used to check that the ONNX pipeline finds the same entities
+CHECK_TEXTS = [
+    "De Korenmarkt 15 in Gent is een belangrijk adres.",
+    "Het college keurt de heraanleg van de Sint-Pietersnieuwstraat tussen de Overpoortstraat en het Sint-Pietersplein goed.",
+    "Tijdelijke parkeerverbod in de Veldstraat 42 en de Zonnestraat te Gent.",
+]
+
+
+def find_transformer_shim(nlp: Any) -> Optional[Any]:
+    """Return the thinc shim that wraps the Hugging Face model of a spaCy pipeline, if any."""
+    for _, proc in nlp.pipeline:
+        if not hasattr(proc, "model"):
+            continue
+        for node in proc.model.walk():
+            for shim in node.shims:
+                if hasattr(getattr(shim, "_model", None), "config"):
+                    return shim
+    return None
+
+
+def _onnx_transformer_class():
+    """Build the torch module class lazily so torch is only imported when ONNX is used."""
+    import numpy
+    import torch
+    from transformers.modeling_outputs import BaseModelOutput
+
+    class OnnxTransformer(torch.nn.Module):
+        """Drop-in replacement for a Hugging Face encoder that runs an ONNX Runtime session."""
+
+        def __init__(self, session: Any, config: Any):
+            super().__init__()
+            self.session = session
+            self.config = config
+            self.input_names = [i.name for i in session.get_inputs()]
+            # Shims look up the model device from its parameters
+            self.device_anchor = torch.nn.Parameter(torch.zeros(0), requires_grad=False)
+
+        def forward(self, input_ids=None, attention_mask=None, **kwargs):
+            inputs = {"input_ids": input_ids, "attention_mask": attention_mask, **kwargs}
+            feed = {name: inputs[name].cpu().numpy().astype(numpy.int64)
+                    for name in self.input_names if inputs.get(name) is not None}
+            last_hidden_state = self.session.run(None, feed)[0]
+            return BaseModelOutput(last_hidden_state=torch.from_numpy(last_hidden_state))
+
+    return OnnxTransformer
+
+
+def use_onnx_backend(nlp: Any, onnx_path: str, threads: int = 0) -> bool:
+    """
+    Replace the PyTorch transformer of a spaCy pipeline by an ONNX Runtime session.
+
+    Args:
+        nlp: Loaded spacy-transformers pipeline
+        onnx_path: Model exported with export_onnx()
+        threads: ONNX Runtime intra-op threads (0 lets ONNX Runtime decide)
+
+    Returns:
+        True if the transformer was replaced
+    """
+    import onnxruntime
+
+    shim = find_transformer_shim(nlp)
+    if shim is None:
+        logger.warning("Pipeline has no transformer to replace; keeping the PyTorch model")
+        return False
+
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if threads > 0:
+        options.intra_op_num_threads = threads
+    session = onnxruntime.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+
+    wrapper = _onnx_transformer_class()(session, shim._model.config)
+    shim._model = wrapper
+    # spacy-transformers also keeps the model in its HFObjects container
+    if hasattr(getattr(shim, "_hfmodel", None), "transformer"):
+        shim._hfmodel.transformer = wrapper
+    logger.info(f"Using ONNX Runtime backend {onnx_path}")
+    return True
+
+
+def export_onnx(model_path: str, output_path: str, quantize: bool = False, opset: int = 14) -> str:
+    """
+    Export the transformer of a spacy-transformers pipeline to ONNX.
+
+    Args:
+        model_path: Path to the spaCy pipeline
+        output_path: Path of the ONNX file to write
+        quantize: Also quantize the weights to INT8 (written to output_path)
+        opset: ONNX opset version
+
+    Returns:
+        Path of the written model
+    """
+    import torch
+    from .ner_models import load_spacy_pipeline
+
+    nlp = load_spacy_pipeline(model_path)
+    shim = find_transformer_shim(nlp)
+    if shim is None:
+        raise ValueError(f"{model_path} has no transformer component to export")
+    hf_model = shim._model.eval()
+
+    class LastHiddenState(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, input_ids, attention_mask):
+            return self.model(input_ids=input_ids, attention_mask=attention_mask, return_dict=False)[0]
+
+    dummy = (torch.ones((1, 16), dtype=torch.long), torch.ones((1, 16), dtype=torch.long))
+    fp32_path = output_path if not quantize else output_path + ".fp32"
+    with torch.no_grad():
+        torch.onnx.export(
+            LastHiddenState(hf_model), dummy, fp32_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "last_hidden_state": {0: "batch", 1: "sequence"},
+            },
+            opset_version=opset,
+        )
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        quantize_dynamic(fp32_path, output_path, weight_type=QuantType.QInt8)
+        os.remove(fp32_path)
+    return output_path
+
+
+def compare_backends(model_path: str, onnx_path: str, texts: List[str]) -> int:
+    """Run texts through the PyTorch and ONNX pipelines; return the number of texts with different entities."""
+    from .ner_models import load_spacy_pipeline
+
+    def entities(nlp):
+        return [[(e.start_char, e.end_char, e.label_) for e in doc.ents] for doc in nlp.pipe(texts)]
+
+    reference = entities(load_spacy_pipeline(model_path))
+    nlp = load_spacy_pipeline(model_path)
+    use_onnx_backend(nlp, onnx_path)
+    return sum(r != o for r, o in zip(reference, entities(nlp)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ONNX Runtime backend tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="Export the transformer of a spaCy pipeline to ONNX")
+    export.add_argument("model", help="Path to the spaCy pipeline (e.g. $NER_MODEL_PATH)")
+    export.add_argument("output", help="Output ONNX model path")
+    export.add_argument("--quantize", action="store_true", help="Quantize the weights to INT8")
+    export.add_argument("--opset", type=int, default=14, help="ONNX opset version")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        path = export_onnx(args.model, args.output, quantize=args.quantize, opset=args.opset)
+        print(f"Wrote {path}")
+        different = compare_backends(args.model, path, CHECK_TEXTS)
+        print(f"Entities identical to PyTorch on {len(CHECK_TEXTS) - different}/{len(CHECK_TEXTS)} check texts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Dynamic INT8 Quantization
+
+Applies torch dynamic quantization (INT8 weights, activations quantized on
+the fly) to the Linear layers of CPU models: plain torch modules (Flair),
+Hugging Face pipelines (title extraction) and spaCy pipelines whose
+transformer runs behind a thinc PyTorch shim (the location model).
+"""
+
+import logging
+from typing import Any
+
+from .ner_config import QUANTIZE_MODELS
+
+logger = logging.getLogger(__name__)
+
+
+def quantization_enabled(kind: str) -> bool:
+    """True if quantization is switched on for a model kind ('geo', 'spacy', 'flair' or 'title')."""
+    return kind in QUANTIZE_MODELS or "all" in QUANTIZE_MODELS
+
+
+def _quantize_module(module: Any) -> int:
+    """Quantize the Linear layers of a torch module in place. Returns the number of quantized layers."""
+    import torch
+
+    linear = sum(1 for m in module.modules() if isinstance(m, torch.nn.Linear))
+    if linear:
+        torch.ao.quantization.quantize_dynamic(module, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    return linear
+
+
+def quantize_model(model: Any) -> int:
+    """
+    Apply dynamic INT8 quantization to a loaded model in place.
+
+    Args:
+        model: torch module, Hugging Face pipeline or spaCy Language
+
+    Returns:
+        Number of quantized Linear layers (0 if the model has no torch parts)
+    """
+    if hasattr(model, "modules") and hasattr(model, "parameters"):
+        count = _quantize_module(model)
+    elif hasattr(getattr(model, "model", None), "modules"):
+        count = _quantize_module(model.model)
+    elif hasattr(model, "pipeline"):
+        count = 0
+        for _, proc in model.pipeline:
+            if not hasattr(proc, "model"):
+                continue
+            for node in proc.model.walk():
+                for shim in node.shims:
+                    if hasattr(getattr(shim, "_model", None), "modules"):
+                        count += _quantize_module(shim._model)
+    else:
+        count = 0
+    logger.info(f"Quantized {count} Linear layers of {type(model).__name__} to INT8")
+    return count
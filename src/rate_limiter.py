@@ -0,0 +1,54 @@
+"""
+Token Bucket Rate Limiter
+
+Thread-safe token bucket shared by all callers of a geocoding backend. Callers
+reserve a token and wait until it becomes available, so the configured
+requests-per-second budget holds across threads and event loops alike.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket with reservation semantics.
+
+    `rate` tokens are added per second up to `burst`. Every acquire reserves
+    one token immediately (possibly driving the balance negative) and returns
+    how long the caller must wait, which keeps waiting callers in FIFO order
+    and never exceeds `burst + rate * t` requests in any window of t seconds.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve one token and return the delay in seconds before it may be used."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,176 @@
+"""
+Basisregisters Vlaanderen Client
+
+Client for the street name and address endpoints of the Flemish address
+register. Uses a keep-alive connection pool, caches resolved URIs (registry
+identifiers practically never change) and can resolve all streets and
+addresses of a document concurrently. With a local RegistrySnapshot, lookups
+are answered from the snapshot first (or only, in offline mode).
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .geocode_cache import normalize_query
+from .geocoding_config import GEOCODING_SETTINGS
+from .memory_cache import MISSING, TTLCache
+from .registry_snapshot import RegistrySnapshot
+
+# (gemeentenaam, straatnaam) for a street, plus (huisnummer[, busnummer]) for an address
+RegistryLookup = Tuple[Optional[str], ...]
+
+
+class BasisregisterClient:
+    """Pooled and cached client for the basisregisters street name and address API."""
+
+    def __init__(self, base_uri: Optional[str] = None, timeout: float = 15, pool_size: int = 8,
+                 cache_ttl: float = 7 * 24 * 3600, cache_max_entries: int = 50_000,
+                 snapshot: Optional[RegistrySnapshot] = None, offline_only: bool = False):
+        self.base_uri = (base_uri or os.getenv("BASE_REGISTRY_URI") or "").rstrip("/")
+        self.timeout = timeout
+        self.pool_size = max(1, pool_size)
+        self.cache = TTLCache(max_entries=cache_max_entries, ttl=cache_ttl)
+        self.snapshot = snapshot
+        self.offline_only = offline_only
+        self.logger = logging.getLogger(__name__)
+
+        self._sess = requests.Session()
+        self._sess.headers.update({"Accept": "application/json"})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        self._sess.mount("https://", adapter)
+        self._sess.mount("http://", adapter)
+
+    def street_uri(self, gemeentenaam: str, straatnaam: str, timeout: Optional[float] = None) -> Optional[str]:
+        """Retrieve the URI for a street."""
+        key = ("street", normalize_query(gemeentenaam), normalize_query(straatnaam))
+        cached = self.cache.get(key)
+        if cached is not MISSING:
+            return cached
+
+        url = f"{self.base_uri}/v2/straatnamen/"
+        if self.snapshot is not None:
+            object_id = self.snapshot.street_object_id(gemeentenaam, straatnaam)
+            # An empty id (e.g. from an older snapshot) counts as missing
+            if object_id or self.offline_only:
+                return url + object_id if object_id else None
+
+        params = {"gemeentenaam": gemeentenaam, "straatnaam": straatnaam}
+        uri = self._first_uri(url, params, "straatnamen", timeout)
+        self.cache.set(key, uri)
+        return uri
+
+    def address_uri(self, gemeentenaam: str, straatnaam: str, huisnummer: str,
+                    busnummer: Optional[str] = None, timeout: Optional[float] = None) -> Optional[str]:
+        """Retrieve the URI for a specific address."""
+        key = ("address", normalize_query(gemeentenaam), normalize_query(straatnaam),
+               normalize_query(str(huisnummer)), normalize_query(str(busnummer)) if busnummer is not None else None)
+        cached = self.cache.get(key)
+        if cached is not MISSING:
+            return cached
+
+        url = f"{self.base_uri}/v2/adressen/"
+        if self.snapshot is not None:
+            object_id = self.snapshot.address_object_id(gemeentenaam, straatnaam, huisnummer, busnummer)
+            # An empty id (e.g. from an older snapshot) counts as missing
+            if object_id or self.offline_only:
+                return url + object_id if object_id else None
+
+        params = {
+            "gemeentenaam": gemeentenaam,
+            "straatnaam": straatnaam,
+            "huisnummer": huisnummer,
+        }
+        if busnummer is not None:
+            params["busnummer"] = busnummer
+        uri = self._first_uri(url, params, "adressen", timeout)
+        self.cache.set(key, uri)
+        return uri
+
+    def _first_uri(self, url: str, params: Dict[str, Any], collection: str, timeout: Optional[float]) -> Optional[str]:
+        """Query a registry collection and build the URI of the first match."""
+        r = self._sess.get(url, params=params, timeout=timeout or self.timeout)
+        r.raise_for_status()
+        data = r.json()
+
+        items = (data or {}).get(collection, [])
+        if not items:
+            return None
+
+        ident = items[0].get("identificator", {})
+        return url + ident.get("objectId")
+
+    def resolve(self, lookup: RegistryLookup) -> Optional[str]:
+        """Resolve a (gemeente, straat) street or (gemeente, straat, huisnummer[, bus]) address lookup."""
+        if len(lookup) == 2:
+            return self.street_uri(*lookup)
+        return self.address_uri(*lookup)
+
+    def resolve_batch(self, lookups: Sequence[RegistryLookup]) -> List[Optional[str]]:
+        """
+        Resolve many street/address lookups concurrently over the connection pool.
+
+        Identical lookups are resolved once. Results are returned in input
+        order; failed lookups are logged and returned as None.
+        """
+        unique = list(dict.fromkeys(lookups))
+
+        def safe_resolve(lookup):
+            try:
+                return self.resolve(lookup)
+            except (requests.RequestException, ValueError) as exc:
+                self.logger.warning("Registry lookup failed for %r: %s", lookup, exc)
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, max(1, len(unique)))) as executor:
+            resolved = dict(zip(unique, executor.map(safe_resolve, unique)))
+        return [resolved[lookup] for lookup in lookups]
+
+    def resolve_detectables(self, detectables: Dict[str, List[Dict[str, Any]]],
+                            default_city: str = "Gent") -> Dict[str, List[Optional[str]]]:
+        """Resolve registry URIs for all streets and addresses detected in a document."""
+        keys = []
+        lookups: List[RegistryLookup] = []
+        for geo_entity, items in detectables.items():
+            for detectable in items:
+                city = detectable.get("city") or default_city
+                if detectable.get("type") == "HOUSE" and detectable.get("house_number"):
+                    bus = detectable.get("bus")
+                    lookup = (city, detectable["name"], str(detectable["house_number"]),
+                              str(bus) if bus is not None else None)
+                else:
+                    lookup = (city, detectable["name"])
+                keys.append(geo_entity)
+                lookups.append(lookup)
+
+        results: Dict[str, List[Optional[str]]] = {geo_entity: [] for geo_entity in detectables}
+        for geo_entity, uri in zip(keys, self.resolve_batch(lookups)):
+            results[geo_entity].append(uri)
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics."""
+        return self.cache.stats()
+
+
+_client: Optional[BasisregisterClient] = None
+
+
+def get_registry_client() -> BasisregisterClient:
+    """Return the shared registry client, created on first use."""
+    global _client
+    if _client is None:
+        _client = BasisregisterClient(
+            pool_size=GEOCODING_SETTINGS["registry_pool_size"],
+            cache_ttl=GEOCODING_SETTINGS["registry_cache_ttl"],
+            cache_max_entries=GEOCODING_SETTINGS["registry_cache_max_entries"],
+            snapshot=RegistrySnapshot(
+                GEOCODING_SETTINGS["registry_snapshot_path"]
+            ) if GEOCODING_SETTINGS["registry_snapshot_path"] else None,
+            offline_only=GEOCODING_SETTINGS["registry_offline_only"]
+        )
+    return _client
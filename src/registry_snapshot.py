@@ -0,0 +1,152 @@
+"""
+Offline Basisregister Snapshot
+
+Compact local index of the Flemish address register
+(municipality -> street -> house number -> bus -> objectId) so street and
+address URIs can be resolved without calling the registry API.
+
+Build the index from a CSV dump of the address register with:
+
+    python -m src.registry_snapshot build adressen.csv registry.sqlite
+
+The dump needs one row per address with the columns `gemeentenaam`,
+`straatnaam`, `straatnaamid`, `huisnummer`, `busnummer` and `adresid`
+(column names are matched case-insensitively; `;` and `,` separated files are
+both accepted). Rows without `adresid` only register the street.
+"""
+
+import argparse
+import csv
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+from .geocode_cache import normalize_query
+
+COLUMNS = {
+    "gemeentenaam": ("gemeentenaam", "gemeente", "municipality"),
+    "straatnaam": ("straatnaam", "street"),
+    "straatnaamid": ("straatnaamid", "straatnaam_id", "streetnameid"),
+    "huisnummer": ("huisnummer", "housenumber"),
+    "busnummer": ("busnummer", "boxnumber"),
+    "adresid": ("adresid", "adres_id", "addressid"),
+}
+
+
+class RegistrySnapshot:
+    """Read-only lookups of registry objectIds in a local SQLite snapshot."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+
+    def street_object_id(self, gemeentenaam: str, straatnaam: str) -> Optional[str]:
+        """Return the objectId of a street, or None if it is not in the snapshot."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT object_id FROM streets WHERE gemeente = ? AND straat = ?",
+                (normalize_query(gemeentenaam), normalize_query(straatnaam))).fetchone()
+        return row[0] if row else None
+
+    def address_object_id(self, gemeentenaam: str, straatnaam: str, huisnummer: str,
+                          busnummer: Optional[str] = None) -> Optional[str]:
+        """Return the objectId of an address, or None if it is not in the snapshot."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT object_id FROM addresses WHERE gemeente = ? AND straat = ? AND huisnummer = ? AND bus = ?",
+                (normalize_query(gemeentenaam), normalize_query(straatnaam), normalize_query(str(huisnummer)),
+                 normalize_query(str(busnummer)) if busnummer is not None else "")).fetchone()
+        return row[0] if row else None
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of streets and addresses in the snapshot."""
+        with self._lock:
+            streets = self._conn.execute("SELECT COUNT(*) FROM streets").fetchone()[0]
+            addresses = self._conn.execute("SELECT COUNT(*) FROM addresses").fetchone()[0]
+        return {"streets": streets, "addresses": addresses}
+
+    @staticmethod
+    def build(dump_path: str, index_path: str) -> Dict[str, int]:
+        """
+        Build a snapshot index from a CSV dump of the address register.
+
+        Returns:
+            Number of streets and addresses written to the index
+        """
+        conn = sqlite3.connect(index_path)
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS streets")
+            conn.execute("DROP TABLE IF EXISTS addresses")
+            conn.execute(
+                "CREATE TABLE streets (gemeente TEXT NOT NULL, straat TEXT NOT NULL, object_id TEXT NOT NULL,"
+                " PRIMARY KEY (gemeente, straat)) WITHOUT ROWID")
+            conn.execute(
+                "CREATE TABLE addresses (gemeente TEXT NOT NULL, straat TEXT NOT NULL,"
+                " huisnummer TEXT NOT NULL, bus TEXT NOT NULL, object_id TEXT NOT NULL,"
+                " PRIMARY KEY (gemeente, straat, huisnummer, bus)) WITHOUT ROWID")
+
+            with open(dump_path, newline="", encoding="utf-8-sig") as f:
+                dialect = csv.Sniffer().sniff(f.read(4096), delimiters=";,")
+                f.seek(0)
+                reader = csv.DictReader(f, dialect=dialect)
+                fields = {name.lower(): name for name in reader.fieldnames or []}
+                columns = {}
+                for key, candidates in COLUMNS.items():
+                    columns[key] = next((fields[c] for c in candidates if c in fields), None)
+                missing = [key for key in ("gemeentenaam", "straatnaam", "straatnaamid") if columns[key] is None]
+                if missing:
+                    raise ValueError(f"Registry dump is missing required columns: {', '.join(missing)}")
+
+                def value(row, key):
+                    column = columns[key]
+                    return (row.get(column) or "").strip() if column else ""
+
+                streets, addresses = [], []
+                for row in reader:
+                    gemeente = normalize_query(value(row, "gemeentenaam"))
+                    straat = normalize_query(value(row, "straatnaam"))
+                    if not gemeente or not straat:
+                        continue
+                    straat_id = value(row, "straatnaamid")
+                    # Rows without an id must not replace the id of an earlier row for the street
+                    if straat_id:
+                        streets.append((gemeente, straat, straat_id))
+                    adres_id = value(row, "adresid")
+                    huisnummer = value(row, "huisnummer")
+                    if adres_id and huisnummer:
+                        addresses.append((gemeente, straat, normalize_query(huisnummer),
+                                          normalize_query(value(row, "busnummer")), adres_id))
+                    if len(addresses) >= 50_000:
+                        conn.executemany("INSERT OR REPLACE INTO addresses VALUES (?, ?, ?, ?, ?)", addresses)
+                        addresses.clear()
+                    if len(streets) >= 50_000:
+                        conn.executemany("INSERT OR REPLACE INTO streets VALUES (?, ?, ?)", streets)
+                        streets.clear()
+                conn.executemany("INSERT OR REPLACE INTO addresses VALUES (?, ?, ?, ?, ?)", addresses)
+                conn.executemany("INSERT OR REPLACE INTO streets VALUES (?, ?, ?)", streets)
+
+            counts = {
+                "streets": conn.execute("SELECT COUNT(*) FROM streets").fetchone()[0],
+                "addresses": conn.execute("SELECT COUNT(*) FROM addresses").fetchone()[0],
+            }
+        conn.execute("VACUUM")
+        conn.close()
+        return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Basisregister snapshot tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Build a snapshot index from a CSV dump of the address register")
+    build.add_argument("dump", help="CSV dump of the address register")
+    build.add_argument("index", help="Output SQLite index path")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        counts = RegistrySnapshot.build(args.dump, args.index)
+        print(f"Wrote {counts['streets']} streets and {counts['addresses']} addresses to {args.index}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+SQLite-backed Key/Value Cache
+
+Small persistent cache used to keep expensive lookup results across container
+restarts. Entries have a per-entry expiry time and the table is bounded in size
+with least-recently-used eviction.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class SqliteCache:
+    """
+    Persistent LRU + TTL cache stored in a single SQLite file.
+
+    Values are serialized with `encode`/`decode` (JSON by default). The cache
+    is safe to share between threads; all access goes through one connection
+    guarded by a lock.
+    """
+
+    def __init__(self, path: str, table: str = "cache", max_entries: int = 100_000,
+                 ttl: Optional[float] = None,
+                 encode: Callable[[Any], bytes] = lambda v: json.dumps(v).encode("utf-8"),
+                 decode: Callable[[bytes], Any] = lambda b: json.loads(b.decode("utf-8"))):
+        self.path = path
+        self.table = table
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.encode = encode
+        self.decode = decode
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB,"
+            " expires_at REAL,"
+            " last_access REAL NOT NULL)")
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_last_access ON {table} (last_access)")
+        self._size = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default` on a miss or expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self._size -= 1
+                self.misses += 1
+                return default
+            self._conn.execute(
+                f"UPDATE {self.table} SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return self.decode(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key`, using `ttl` seconds or the cache default."""
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        blob = self.encode(value)
+        with self._lock:
+            exists = self._conn.execute(
+                f"SELECT 1 FROM {self.table} WHERE key = ?", (key,)).fetchone() is not None
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?)", (key, blob, expires_at, now))
+            if not exists:
+                self._size += 1
+                if self._size > self.max_entries:
+                    self._evict()
+
+    def delete(self, key: str) -> None:
+        """Remove `key` from the cache if present."""
+        with self._lock:
+            self._size -= self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key = ?", (key,)).rowcount
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+            self._size = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones above `max_entries`."""
+        self._size -= self._conn.execute(
+            f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),)).rowcount
+        overflow = self._size - self.max_entries
+        if overflow > 0:
+            self._size -= self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN ("
+                f" SELECT key FROM {self.table} ORDER BY last_access ASC LIMIT ?)", (overflow,)).rowcount
+            self.evictions += overflow
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and the current size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self),
+            "max_entries": self.max_entries,
+        }
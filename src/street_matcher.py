@@ -0,0 +1,104 @@
+"""
+Fuzzy Street Name Matching
+
+Canonicalizes noisy NER spans ("de Korenmarkt", "Sint-Pietersnieuwstr.",
+missing diacritics, typos) to a known street name before geocoding, so that
+variants of one street share a single cached lookup.
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .geocode_cache import normalize_query
+
+# Abbreviations expanded before matching (applied to normalized text)
+ABBREVIATIONS = [
+    (r"\bst(?:\.\s*-?|-|\s)\s*(?=[a-z])", "sint-"),
+    (r"\bo\.?\s*-?l\.?\s*-?\s*vrouw", "onze-lieve-vrouw"),
+    (r"str\.?$", "straat"),
+    (r"stwg\.?$", "steenweg"),
+    (r"stw\.?$", "steenweg"),
+    (r"\bln\.?$", "laan"),
+    (r"\bpl\.?$", "plein"),
+    (r"\bbd\.?$", "boulevard"),
+    (r"\bbld\.?$", "boulevard"),
+]
+
+# Leading words that NER spans often include but street names do not
+STRAY_PREFIXES = re.compile(r"^(?:(?:in|op|aan|langs|naar|van|via)\s+)?(?:de|het|den|der|'t)\s+")
+
+
+def canonical_form(name: str) -> str:
+    """Normalize a street name and expand common abbreviations."""
+    value = normalize_query(name)
+    value = STRAY_PREFIXES.sub("", value)
+    for pattern, replacement in ABBREVIATIONS:
+        value = re.sub(pattern, replacement, value)
+    value = re.sub(r"\s*-\s*", "-", value)
+    # "ij" and "y" are interchangeable in (old) Dutch spellings
+    value = value.replace("ij", "y")
+    return value.strip(" .,")
+
+
+def trigrams(value: str) -> Set[str]:
+    """Return the set of character trigrams of a padded string."""
+    padded = f"  {value} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class StreetNameMatcher:
+    """
+    Trigram index over known street names.
+
+    `match()` returns the best matching known name with a Dice similarity
+    score in [0, 1], or None when nothing reaches `threshold`.
+    """
+
+    def __init__(self, names: Iterable[str], threshold: float = 0.75):
+        self.threshold = threshold
+        self._names: List[str] = []
+        self._grams: List[Set[str]] = []
+        self._exact: Dict[str, int] = {}
+        self._index: Dict[str, List[int]] = defaultdict(list)
+
+        for name in names:
+            form = canonical_form(name)
+            if not form or form in self._exact:
+                continue
+            idx = len(self._names)
+            grams = trigrams(form)
+            self._names.append(name)
+            self._grams.append(grams)
+            self._exact[form] = idx
+            for gram in grams:
+                self._index[gram].append(idx)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def match(self, span: str) -> Optional[Tuple[str, float]]:
+        """Return (known street name, similarity) for a span, or None."""
+        form = canonical_form(span)
+        if not form:
+            return None
+        idx = self._exact.get(form)
+        if idx is not None:
+            return self._names[idx], 1.0
+
+        grams = trigrams(form)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for idx in self._index.get(gram, ()):
+                shared[idx] += 1
+        if not shared:
+            return None
+
+        best_idx, best_score = None, 0.0
+        for idx, count in shared.items():
+            score = 2.0 * count / (len(grams) + len(self._grams[idx]))
+            if score > best_score:
+                best_idx, best_score = idx, score
+        if best_score < self.threshold:
+            return None
+        return self._names[best_idx], round(best_score, 3)
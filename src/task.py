@@ -2,6 +2,7 @@ import contextlib
 import logging
 import os
 import json
+import threading
 from abc import ABC, abstractmethod
 from typing import Optional, Any
 
@@ -10,10 +11,15 @@ from string import Template
 from helpers import query
 from escape_helpers import sparql_escape_uri, sparql_escape_string
 
-from .helper_functions import clean_string, get_start_end_offsets, process_text, geocode_detectable
+from .helper_functions import clean_string, get_start_end_offsets, process_text, geocode_batch
 from .ner_extractors import SpacyGeoAnalyzer
 from .ner_functions import extract_entities
-from .nominatim_geocoder import NominatimGeocoder
+from .ner_config import GEO_NER_SETTINGS
+from .ner_workers import get_worker_pool
+from .doc_cache import get_doc_cache
+from .geocoding import create_gazetteer, create_geocoder, create_street_matcher
+from .geocoding_config import GEOCODING_SETTINGS
+from .circuit_breaker import BackendUnavailableError, CircuitOpenError
 from .annotation import GeoAnnotation, TripletAnnotation
 from .sparql_config import get_prefixes_for_query, GRAPHS, JOB_STATUSES, TASK_OPERATIONS, AI_COMPONENTS, AGENT_TYPES
 
@@ -102,9 +108,30 @@ class Task(ABC):
     def run(self):
         """Context manager for task execution with state transitions."""
         self.change_state("scheduled", "busy")
-        yield
+        try:
+            yield
+        except BackendUnavailableError as e:
+            # A backend is unavailable: retry the task later instead of failing it for good
+            self.defer(max(e.retry_after, 1.0))
+            return
+        except Exception:
+            self.change_state("busy", "failed")
+            raise
         self.change_state("busy", "success")
 
+    def defer(self, delay: float) -> None:
+        """
+        Move the task back to scheduled after `delay` seconds.
+
+        The status change triggers a new delta notification, which runs the
+        task again; waiting first avoids busy/scheduled flapping while the
+        backend is still down.
+        """
+        self.logger.warning(f"Deferring task {self.task_uri} for {delay:.1f}s")
+        timer = threading.Timer(delay, self.change_state, args=("busy", "scheduled"))
+        timer.daemon = True
+        timer.start()
+
     def execute(self):
         """Run the task and handle state transitions."""
         with self.run():
@@ -157,8 +184,22 @@ class GeoExtractionTask(DecisionTask):
 
     __task_type__ = TASK_OPERATIONS["geo_extraction"]
 
-    ner_analyzer = SpacyGeoAnalyzer(model_path=os.getenv("NER_MODEL_PATH"), labels=json.loads(os.getenv("NER_LABELS")))
-    geocoder = NominatimGeocoder(base_url=os.getenv("NOMINATIM_BASE_URL"), rate_limit=0.5)
+    ner_analyzer = SpacyGeoAnalyzer(
+        model_path=os.getenv("NER_MODEL_PATH"),
+        labels=json.loads(os.getenv("NER_LABELS")),
+        batch_size=GEO_NER_SETTINGS["batch_size"],
+        batch_wait_ms=GEO_NER_SETTINGS["batch_wait_ms"],
+        worker_pool=get_worker_pool(),
+        chunk_chars=GEO_NER_SETTINGS["chunk_chars"],
+        chunk_overlap=GEO_NER_SETTINGS["chunk_overlap"],
+        lazy=True,
+        onnx_path=GEO_NER_SETTINGS["onnx_path"],
+        onnx_threads=GEO_NER_SETTINGS["onnx_threads"],
+        doc_cache=get_doc_cache()
+    )
+    gazetteer = create_gazetteer()
+    geocoder = create_geocoder(gazetteer)
+    street_matcher = create_street_matcher(gazetteer)
 
     def apply_geo_entities(self, task_data: str):
         """Extract geographic entities from text and store as annotations."""
@@ -172,30 +213,44 @@ class GeoExtractionTask(DecisionTask):
         else:
             # Geocoding Results
             if detectables:
+                geocoder = self.__class__.geocoder
+                if not geocoder.available:
+                    # Fail fast instead of waiting on timeouts; Task.run defers the task until retry_after
+                    raise CircuitOpenError(geocoder.retry_after)
+
                 self.logger.info("Geocoding Results")
+                results = geocode_batch(detectables, geocoder, default_city,
+                                        self.__class__.street_matcher,
+                                        street_geometry=GEOCODING_SETTINGS["street_geometry"],
+                                        tolerance=GEOCODING_SETTINGS["geometry_tolerance"])
 
                 for geo_entity in ["streets", "addresses"]:
                     if geo_entity in detectables:
-                        for detectable in detectables[geo_entity]:
-                            result = geocode_detectable(detectable, self.__class__.geocoder, default_city)
+                        for detectable, result in zip(detectables[geo_entity], results[geo_entity]):
                             print(result)
 
-                            if result["success"]:
+                            # Skip streets without a geometry (e.g. GEOCODE_STREET_GEOMETRY=none)
+                            if result["success"] and result.get("geojson"):
                                 if geo_entity == "streets":
                                     offsets = get_start_end_offsets(task_data, detectable["name"])
                                     start_offset = offsets[0][0]
                                     end_offset = offsets[0][1]
-                                    annotation = GeoAnnotation(
-                                        result.get("geojson", {}),
-                                        self.task_uri,
-                                        self.source,
-                                        "http://example.org/{0}".format(uuid4()),
-                                        start_offset,
-                                        end_offset,
-                                        AI_COMPONENTS["ner_extractor"],
-                                        AGENT_TYPES["ai_component"]
-                                    )
-                                    annotation.add_to_triplestore()
+                                    try:
+                                        annotation = GeoAnnotation(
+                                            result["geojson"],
+                                            self.task_uri,
+                                            self.source,
+                                            "http://example.org/{0}".format(uuid4()),
+                                            start_offset,
+                                            end_offset,
+                                            AI_COMPONENTS["ner_extractor"],
+                                            AGENT_TYPES["ai_component"]
+                                        )
+                                    except ValueError as e:
+                                        # Malformed geometry from the geocoder: skip this street only
+                                        self.logger.warning(f"Skipping annotation for '{detectable['name']}': {e}")
+                                    else:
+                                        annotation.add_to_triplestore()
                             self.logger.info(result)
             else:
                 self.logger.info("No location entities detected.")
@@ -0,0 +1,96 @@
+"""
+Text Chunking for NER
+
+Splits long documents into bounded, overlapping windows on paragraph or
+sentence boundaries so NER models never see more than `max_chars` characters
+at once, and maps the entities found in the windows back onto the original
+text.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Positions where a window may start or end: after a paragraph break or after
+# sentence-ending punctuation followed by whitespace
+_BOUNDARY = re.compile(r"\n\s*\n|(?<=[.!?;:])\s+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _boundaries(text: str) -> List[int]:
+    return [m.end() for m in _BOUNDARY.finditer(text)]
+
+
+def chunk_text(text: str, max_chars: int, overlap: int = 0) -> List[Tuple[int, str]]:
+    """
+    Split text into windows of at most `max_chars` characters.
+
+    Windows end on the last paragraph/sentence boundary that fits (or on
+    whitespace, or hard at `max_chars` if there is none). Each next window
+    starts on the first boundary within `overlap` characters before the end of
+    the previous one, so entities near a cut are seen whole at least once. A
+    window that would not reach past the end of the previous one (a long
+    stretch without boundaries follows) starts at that end instead.
+
+    Returns:
+        List of (offset, chunk) tuples, with offset the start of the chunk in text
+    """
+    if max_chars <= 0 or len(text) <= max_chars:
+        return [(0, text)]
+
+    boundaries = _boundaries(text)
+    chunks = []
+    start = previous_end = 0
+    while start < len(text):
+        limit = start + max_chars
+        if limit >= len(text):
+            chunks.append((start, text[start:]))
+            break
+
+        end = max((b for b in boundaries if start < b <= limit), default=None)
+        if end is None:
+            spaces = [m.end() for m in _WHITESPACE.finditer(text, start + max_chars // 2, limit)]
+            end = spaces[-1] if spaces else limit
+        if end <= previous_end:
+            # Backing up into the overlap gains nothing here; continue without overlap
+            start = previous_end
+            continue
+        chunks.append((start, text[start:end]))
+        previous_end = end
+
+        next_start = min((b for b in boundaries if max(start + 1, end - overlap) <= b < end), default=end)
+        start = next_start
+    return chunks
+
+
+def merge_chunk_entities(chunk_entities: Iterable[Tuple[int, List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+    """
+    Remap entities found in chunks to offsets in the original text and merge overlap duplicates.
+
+    Args:
+        chunk_entities: (chunk offset, entities) pairs, entities with keys text, label, start, end
+
+    Returns:
+        Entities sorted by start; of overlapping entities with the same label only
+        the longest is kept
+    """
+    entities = []
+    for offset, items in chunk_entities:
+        for entity in items:
+            remapped = dict(entity)
+            if entity['end'] > entity['start']:
+                remapped['start'] = entity['start'] + offset
+                remapped['end'] = entity['end'] + offset
+            entities.append(remapped)
+
+    entities.sort(key=lambda e: (e['start'], -(e['end'] - e['start'])))
+    merged: List[Dict[str, Any]] = []
+    for entity in entities:
+        duplicate = next((kept for kept in merged
+                          if kept['label'] == entity['label']
+                          and kept['start'] < entity['end'] and entity['start'] < kept['end']), None)
+        if duplicate is None:
+            if not any(kept == entity for kept in merged):
+                merged.append(entity)
+        elif entity['end'] - entity['start'] > duplicate['end'] - duplicate['start']:
+            merged[merged.index(duplicate)] = entity
+    return merged
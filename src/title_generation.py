@@ -0,0 +1,316 @@
+"""
+Bounded Title Generation
+
+Runs the title extraction model with generate() directly instead of through
+the text-generation pipeline, so generation can stop as soon as the model
+has closed its JSON answer and the number of new tokens can be capped from
+the document length. A title is a few dozen tokens; without these bounds a
+rambling generation can run for thousands of tokens on CPU.
+
+Every prompt starts with the same chat template and instruction, so the
+key/value cache of that prefix is computed once (PromptPrefixCache) and a copy
+of it is reused per document; only the document and answer tokens are run
+through the model.
+
+For backfills, generate_titles() runs many documents as left-padded batches
+of similar prompt length within a token budget (without the prefix cache).
+
+Imported lazily (it imports torch and transformers).
+"""
+
+import copy
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import torch
+from transformers import DynamicCache, StoppingCriteria, StoppingCriteriaList
+
+from .ner_config import NER_MODELS, TITLE_EXTRACTION_INSTRUCTION
+
+logger = logging.getLogger(__name__)
+
+# Stands in for the document when rendering the prompt to find the fixed prefix
+_DOCUMENT_MARKER = "\x00document\x00"
+
+
+class JsonObjectScanner:
+    """Incrementally scans text and reports when a top-level JSON object has been closed."""
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.done = False
+
+    def feed(self, text: str) -> bool:
+        for ch in text:
+            if self.done:
+                break
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"' and self.depth:
+                self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+            elif ch == "}" and self.depth:
+                self.depth -= 1
+                self.done = self.depth == 0
+        return self.done
+
+
+class JsonObjectStoppingCriteria(StoppingCriteria):
+    """Stop each sequence of a batch once its generated text holds a complete JSON object."""
+
+    def __init__(self, tokenizer: Any, prompt_length: int):
+        self.tokenizer = tokenizer
+        self.seen = prompt_length
+        self.scanners = None
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+        if self.scanners is None:
+            self.scanners = [JsonObjectScanner() for _ in range(input_ids.shape[0])]
+        new_tokens = input_ids[:, self.seen:]
+        self.seen = input_ids.shape[1]
+        for row, scanner in enumerate(self.scanners):
+            if not scanner.done:
+                scanner.feed(self.tokenizer.decode(new_tokens[row], skip_special_tokens=True))
+        return torch.tensor([scanner.done for scanner in self.scanners], dtype=torch.bool, device=input_ids.device)
+
+    def stopped(self, row: int = 0) -> bool:
+        return bool(self.scanners) and self.scanners[row].done
+
+
+def title_prompt(text: str) -> str:
+    """The user message sent to the title model for a document."""
+    return f"{TITLE_EXTRACTION_INSTRUCTION}\n\nText:\n{text}"
+
+
+def prompt_ids(tokenizer: Any, text: str) -> torch.LongTensor:
+    """Token ids (1 x n) of the chat-formatted title prompt for a document."""
+    conversation = [{"role": "user", "content": title_prompt(text)}]
+    rendered = tokenizer.apply_chat_template(conversation, add_generation_prompt=True, tokenize=False)
+    return tokenizer(rendered, add_special_tokens=False, return_tensors="pt")["input_ids"]
+
+
+class PromptPrefixCache:
+    """Key/value cache of the fixed part (chat template + instruction) that starts every title prompt."""
+
+    def __init__(self, model: Any, tokenizer: Any):
+        conversation = [{"role": "user", "content": title_prompt(_DOCUMENT_MARKER)}]
+        rendered = tokenizer.apply_chat_template(conversation, add_generation_prompt=True, tokenize=False)
+        prefix = rendered[:rendered.index(_DOCUMENT_MARKER)]
+        self.prefix_ids = tokenizer(prefix, add_special_tokens=False, return_tensors="pt")["input_ids"]
+
+        start = time.perf_counter()
+        with torch.no_grad():
+            cache = model(self.prefix_ids, use_cache=True).past_key_values
+        # Only a growable cache can be extended with the document and answer tokens
+        self.cache: Optional[DynamicCache] = cache if isinstance(cache, DynamicCache) else None
+        if self.cache is None:
+            logger.warning(f"Model returned a {type(cache).__name__}; prompt prefix caching disabled")
+        else:
+            logger.info(f"Cached {self.length} prompt prefix tokens in {time.perf_counter() - start:.2f}s")
+
+    @property
+    def length(self) -> int:
+        return int(self.prefix_ids.shape[1])
+
+    def matches(self, input_ids: torch.LongTensor) -> bool:
+        """True if the cache can be used for a single prompt (it starts with exactly the cached tokens)."""
+        return (self.cache is not None and input_ids.shape[0] == 1 and input_ids.shape[1] > self.length
+                and torch.equal(input_ids[0, :self.length], self.prefix_ids[0]))
+
+    def copy(self) -> DynamicCache:
+        """A copy of the prefix cache for one generation (generate() extends the cache in place)."""
+        return copy.deepcopy(self.cache)
+
+
+def title_token_cap(document_tokens: int, max_title_tokens: Optional[int] = None) -> int:
+    """
+    Maximum number of new tokens for a document of `document_tokens` tokens.
+
+    The title is a phrase from the document, so the answer needs at most the
+    JSON overhead plus min(document length, max_title_tokens) tokens.
+    """
+    settings = NER_MODELS['title_extraction']
+    max_title_tokens = settings['max_title_tokens'] if max_title_tokens is None else max_title_tokens
+    cap = settings['json_overhead_tokens'] + min(document_tokens, max_title_tokens)
+    return min(cap, settings['max_new_tokens'])
+
+
+def _continue_truncated(model: Any, tokenizer: Any, prompt: torch.LongTensor, generated: torch.LongTensor,
+                        document_tokens: int) -> Tuple[torch.LongTensor, bool]:
+    """
+    Continue an answer that hit its token cap before the JSON object was closed.
+
+    The title may then be longer than max_title_tokens, so generation continues
+    (from the tokens already generated) up to the bound for the whole document.
+
+    Returns:
+        All new tokens (generated + continuation) and whether the JSON was closed
+    """
+    extra = title_token_cap(document_tokens, max_title_tokens=document_tokens) - int(generated.shape[0])
+    if extra <= 0:
+        return generated, False
+    logger.info(f"Title answer not closed after {generated.shape[0]} tokens; continuing for up to {extra} more")
+
+    input_ids = torch.cat([prompt, generated]).unsqueeze(0)
+    stopper = JsonObjectStoppingCriteria(tokenizer, input_ids.shape[1])
+    stopper.scanners = [JsonObjectScanner()]
+    stopper.scanners[0].feed(tokenizer.decode(generated, skip_special_tokens=True))
+    with torch.no_grad():
+        output = model.generate(
+            input_ids,
+            attention_mask=torch.ones_like(input_ids),
+            max_new_tokens=extra,
+            stopping_criteria=StoppingCriteriaList([stopper]),
+        )
+    return output[0, prompt.shape[0]:], stopper.stopped()
+
+
+def generate_title(generator: Any, text: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Generate the JSON title answer for a document.
+
+    Args:
+        generator: Title extraction text-generation pipeline (provides model and tokenizer)
+        text: Document text
+
+    Returns:
+        Generated text and generation stats (prompt/generated token counts, cap, seconds)
+    """
+    tokenizer, model = generator.tokenizer, generator.model
+    input_ids = prompt_ids(tokenizer, text)
+    document_tokens = len(tokenizer(text, add_special_tokens=False)["input_ids"])
+    max_new_tokens = title_token_cap(document_tokens)
+    stopper = JsonObjectStoppingCriteria(tokenizer, input_ids.shape[1])
+
+    kwargs = {}
+    prefix_cache = getattr(generator, "prefix_cache", None)
+    if prefix_cache is not None and prefix_cache.matches(input_ids):
+        kwargs["past_key_values"] = prefix_cache.copy()
+
+    start = time.perf_counter()
+    with torch.no_grad():
+        output = model.generate(
+            input_ids,
+            attention_mask=torch.ones_like(input_ids),
+            max_new_tokens=max_new_tokens,
+            stopping_criteria=StoppingCriteriaList([stopper]),
+            **kwargs,
+        )
+    new_tokens = output[0, input_ids.shape[1]:]
+    stopped = stopper.stopped()
+    continued = not stopped and new_tokens.shape[0] >= max_new_tokens
+    if continued:
+        new_tokens, stopped = _continue_truncated(model, tokenizer, input_ids[0], new_tokens, document_tokens)
+
+    stats = {
+        "prompt_tokens": int(input_ids.shape[1]),
+        "cached_prompt_tokens": prefix_cache.length if "past_key_values" in kwargs else 0,
+        "generated_tokens": int(new_tokens.shape[0]),
+        "max_new_tokens": max_new_tokens,
+        "stopped_on_json": stopped,
+        "continued": continued,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+    return tokenizer.decode(new_tokens, skip_special_tokens=True), stats
+
+
+def plan_batches(lengths: List[int], max_batch_size: int, token_budget: int) -> List[List[int]]:
+    """
+    Group items into batches of similar length.
+
+    Items are sorted by length, so each batch pads to its last item; a batch
+    is closed when adding an item would exceed `max_batch_size` items or
+    `token_budget` padded tokens (batch size x longest length).
+
+    Returns:
+        Batches as lists of item indices
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    for i in sorted(range(len(lengths)), key=lengths.__getitem__):
+        if current and (len(current) + 1 > max_batch_size or (len(current) + 1) * lengths[i] > token_budget):
+            batches.append(current)
+            current = []
+        current.append(i)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def generate_titles(generator: Any, texts: List[str], max_batch_size: Optional[int] = None,
+                    token_budget: Optional[int] = None) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Generate the JSON title answers for many documents in padded batches.
+
+    Args:
+        generator: Title extraction text-generation pipeline
+        texts: Document texts
+        max_batch_size: Documents per batch (default from config)
+        token_budget: Max padded prompt + new tokens per batch (default from config)
+
+    Returns:
+        (generated text, stats) per document, in input order
+    """
+    settings = NER_MODELS['title_extraction']
+    max_batch_size = max_batch_size or settings['batch_size']
+    token_budget = token_budget or settings['batch_token_budget']
+    tokenizer, model = generator.tokenizer, generator.model
+    pad_id = tokenizer.pad_token_id if tokenizer.pad_token_id is not None else tokenizer.eos_token_id
+
+    prompts = [prompt_ids(tokenizer, text)[0] for text in texts]
+    document_tokens = [len(tokenizer(text, add_special_tokens=False)["input_ids"]) for text in texts]
+    caps = [title_token_cap(n) for n in document_tokens]
+    lengths = [len(ids) + cap for ids, cap in zip(prompts, caps)]
+
+    results: List[Optional[Tuple[str, Dict[str, Any]]]] = [None] * len(texts)
+    for batch in plan_batches(lengths, max_batch_size, token_budget):
+        width = max(len(prompts[i]) for i in batch)
+        # Left padding keeps every prompt's last token at the same position
+        input_ids = torch.full((len(batch), width), pad_id, dtype=torch.long)
+        attention_mask = torch.zeros((len(batch), width), dtype=torch.long)
+        for row, i in enumerate(batch):
+            input_ids[row, width - len(prompts[i]):] = prompts[i]
+            attention_mask[row, width - len(prompts[i]):] = 1
+        stopper = JsonObjectStoppingCriteria(tokenizer, width)
+
+        start = time.perf_counter()
+        with torch.no_grad():
+            output = model.generate(
+                input_ids,
+                attention_mask=attention_mask,
+                max_new_tokens=max(caps[i] for i in batch),
+                stopping_criteria=StoppingCriteriaList([stopper]),
+                pad_token_id=pad_id,
+            )
+        seconds = round(time.perf_counter() - start, 3)
+
+        for row, i in enumerate(batch):
+            new_tokens = output[row, width:width + caps[i]]
+            text = tokenizer.decode(new_tokens, skip_special_tokens=True)
+            # Rows may run past their own cap while others in the batch are still generating
+            stopped = JsonObjectScanner().feed(text)
+            continued = not stopped and int((new_tokens != pad_id).sum()) >= caps[i]
+            if continued:
+                new_tokens, stopped = _continue_truncated(model, tokenizer, prompts[i], new_tokens, document_tokens[i])
+                text = tokenizer.decode(new_tokens, skip_special_tokens=True)
+            stats = {
+                "prompt_tokens": len(prompts[i]),
+                "generated_tokens": int((new_tokens != pad_id).sum()),
+                "max_new_tokens": caps[i],
+                "stopped_on_json": stopped,
+                "continued": continued,
+                "batch_size": len(batch),
+                "padded_width": width,
+                "seconds": seconds,
+            }
+            results[i] = (text, stats)
+    return results
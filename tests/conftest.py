@@ -0,0 +1,27 @@
+import json
+
+import pytest
+
+from src.gazetteer import StreetGazetteer
+
+
+def _feature(name, geometry):
+    return {"type": "Feature", "properties": {"name": name, "addr:city": "Gent"}, "geometry": geometry}
+
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    extract = tmp_path / "streets.geojson"
+    extract.write_text(json.dumps({"type": "FeatureCollection", "features": [
+        # Two OSM ways of the same street are merged into a MultiLineString
+        _feature("Veldstraat", {"type": "LineString", "coordinates": [[3.72, 51.05], [3.73, 51.05]]}),
+        _feature("Veldstraat", {"type": "LineString", "coordinates": [[3.73, 51.05], [3.73, 51.04]]}),
+        # Mixed geometry types are merged into a GeometryCollection
+        _feature("Korenmarkt", {"type": "LineString", "coordinates": [[3.72, 51.054], [3.721, 51.055]]}),
+        _feature("Korenmarkt", {"type": "Polygon", "coordinates": [[[3.72, 51.05], [3.721, 51.05],
+                                                                     [3.721, 51.051], [3.72, 51.05]]]}),
+        _feature("Zonnestraat", {"type": "LineString", "coordinates": [[3.71, 51.06], [3.712, 51.061]]}),
+    ]}))
+    index = tmp_path / "gazetteer.sqlite"
+    assert StreetGazetteer.build(str(extract), str(index)) == 3
+    return StreetGazetteer(str(index))
@@ -0,0 +1,26 @@
+from src.geometry import to_wkt
+
+
+def test_linestring_hit(gazetteer):
+    result = gazetteer.search("Zonnestraat", "Gent")
+    assert result["geojson"]["type"] == "LineString"
+    assert to_wkt(result["geojson"]) == "LINESTRING(3.71 51.06, 3.712 51.061)"
+
+
+def test_merged_ways_hit(gazetteer):
+    result = gazetteer.search("veldstraat", "Gent")
+    assert result["geojson"]["type"] == "MultiLineString"
+    assert to_wkt(result["geojson"]) == "MULTILINESTRING((3.72 51.05, 3.73 51.05), (3.73 51.05, 3.73 51.04))"
+
+
+def test_mixed_geometry_hit(gazetteer):
+    result = gazetteer.search("Korenmarkt", "Gent")
+    assert result["geojson"]["type"] == "GeometryCollection"
+    assert to_wkt(result["geojson"]) == (
+        "GEOMETRYCOLLECTION(LINESTRING(3.72 51.054, 3.721 51.055), "
+        "POLYGON((3.72 51.05, 3.721 51.05, 3.721 51.051, 3.72 51.05)))"
+    )
+
+
+def test_miss(gazetteer):
+    assert gazetteer.search("Onbestaandestraat", "Gent") is None
@@ -0,0 +1,20 @@
+import pytest
+
+pytest.importorskip("helpers")
+pytest.importorskip("escape_helpers")
+from src.annotation import GeoAnnotation  # noqa: E402
+
+
+def _annotation(geojson):
+    return GeoAnnotation(geojson, "activity", "source", "http://example.org/1", 0, 10, "agent", "agent-type")
+
+
+def test_gazetteer_hit(gazetteer):
+    annotation = _annotation(gazetteer.search("veldstraat", "Gent")["geojson"])
+    assert annotation.geometry == "MULTILINESTRING((3.72 51.05, 3.73 51.05), (3.73 51.05, 3.73 51.04))"
+    assert "MULTILINESTRING" in annotation.get_extra_inserts()
+
+
+def test_malformed_geometry():
+    with pytest.raises(ValueError):
+        _annotation({"type": "Polygon", "coordinates": [[[3.72, 51.05], [3.73, 51.05]]]})
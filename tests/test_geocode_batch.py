@@ -0,0 +1,63 @@
+import functools
+import time
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from src.async_nominatim_geocoder import AsyncNominatimGeocoder  # noqa: E402
+from src.circuit_breaker import BackendUnavailableError, CircuitBreaker, CircuitOpenError  # noqa: E402
+from src.helper_functions import geocode_batch  # noqa: E402
+
+STREETS = ["Veldstraat", "Korenmarkt", "Zonnestraat", "Kouter"]
+
+
+def _nominatim(request):
+    street = request.url.params["q"].split(",")[0]
+    if street == "Kouter" and request.headers.get("x-fail"):
+        raise httpx.ConnectError("connection refused", request=request)
+    return httpx.Response(200, json=[{"display_name": f"{street}, Gent", "lat": "51.05", "lon": "3.72",
+                                      "geojson": {"type": "Point", "coordinates": [3.72, 51.05]}}])
+
+
+@pytest.fixture
+def geocoder(monkeypatch):
+    def make(handler=_nominatim, headers=None):
+        monkeypatch.setattr(httpx, "AsyncClient", functools.partial(
+            httpx.AsyncClient, transport=httpx.MockTransport(handler), headers=headers))
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        return AsyncNominatimGeocoder("http://nominatim", requests_per_second=1000, breaker=breaker)
+    return make
+
+
+def _detectables():
+    return {"streets": [{"name": name, "type": "STREET"} for name in STREETS]}
+
+
+def test_batch_succeeds(geocoder):
+    results = geocode_batch(_detectables(), geocoder())
+    assert [r["success"] for r in results["streets"]] == [True] * len(STREETS)
+
+
+def test_half_open_breaker_probes_before_fanning_out(geocoder):
+    nominatim = geocoder()
+    nominatim.breaker.record_failure()
+    assert nominatim.breaker.state == "open"
+    time.sleep(0.06)
+    assert nominatim.recovering
+
+    results = geocode_batch(_detectables(), nominatim)
+    assert [r["success"] for r in results["streets"]] == [True] * len(STREETS)
+    assert nominatim.breaker.state == "closed"
+
+
+def test_open_breaker_raises(geocoder):
+    nominatim = geocoder()
+    nominatim.breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        geocode_batch(_detectables(), nominatim)
+
+
+def test_transport_error_raises(geocoder):
+    with pytest.raises(BackendUnavailableError):
+        geocode_batch(_detectables(), geocoder(headers={"x-fail": "1"}))
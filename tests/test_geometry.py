@@ -0,0 +1,37 @@
+from src.geometry import to_wkt
+
+
+def test_point_and_lines():
+    assert to_wkt({"type": "Point", "coordinates": [3.72, 51.05]}) == "POINT(3.72 51.05)"
+    assert to_wkt({"type": "LineString", "coordinates": [[3.72, 51.05], [3.73, 51.06]]}) == \
+        "LINESTRING(3.72 51.05, 3.73 51.06)"
+    assert to_wkt({"type": "MultiLineString", "coordinates": [[[1, 2], [3, 4]], [[5, 6], [7, 8]]]}) == \
+        "MULTILINESTRING((1 2, 3 4), (5 6, 7 8))"
+
+
+def test_polygon():
+    ring = [[3.72, 51.05], [3.73, 51.05], [3.73, 51.06], [3.72, 51.05]]
+    assert to_wkt({"type": "Polygon", "coordinates": [ring]}) == \
+        "POLYGON((3.72 51.05, 3.73 51.05, 3.73 51.06, 3.72 51.05))"
+    assert to_wkt({"type": "MultiPolygon", "coordinates": [[ring]]}) == \
+        "MULTIPOLYGON(((3.72 51.05, 3.73 51.05, 3.73 51.06, 3.72 51.05)))"
+
+
+def test_missing_geometry():
+    assert to_wkt(None) is None
+    assert to_wkt({}) is None
+    assert to_wkt({"type": "Unknown", "coordinates": [1, 2]}) is None
+
+
+def test_malformed_coordinates():
+    # A ring given as a bare list of positions (missing one nesting level)
+    assert to_wkt({"type": "Polygon", "coordinates": [[3.72, 51.05], [3.73, 51.06]]}) is None
+    # A ring that is not closed
+    assert to_wkt({"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1]]]}) is None
+    assert to_wkt({"type": "Point", "coordinates": [[3.72, 51.05]]}) is None
+    assert to_wkt({"type": "LineString", "coordinates": [[3.72, 51.05]]}) is None
+    assert to_wkt({"type": "MultiLineString", "coordinates": [[3.72, 51.05], [3.73, 51.06]]}) is None
+    assert to_wkt({"type": "GeometryCollection", "geometries": [
+        {"type": "Point", "coordinates": [3.72, 51.05]},
+        {"type": "Polygon", "coordinates": [[3.72, 51.05]]},
+    ]}) is None
@@ -0,0 +1,51 @@
+import pytest
+
+from src.ner_workers import NerWorkerPool
+
+
+class _Pool:
+    def __init__(self, ready):
+        self.ready = ready
+        self.calls = 0
+
+    def warm_up(self):
+        self.calls += 1
+        return self.ready
+
+
+@pytest.fixture
+def worker_pool():
+    pool = NerWorkerPool(workers=2, start_method="spawn")
+    yield pool
+    pool.shutdown()
+
+
+def test_warm_up_fails_without_model(worker_pool):
+    assert worker_pool.warm_up(timeout=60) is False
+
+
+def test_warm_up_every_worker_loaded(tmp_path):
+    spacy = pytest.importorskip("spacy")
+    spacy.blank("nl").to_disk(tmp_path)
+    pool = NerWorkerPool(workers=2, geo_model_path=str(tmp_path), start_method="spawn")
+    try:
+        assert pool.warm_up(timeout=60) is True
+        assert len(pool._executor._processes) == 2
+    finally:
+        pool.shutdown()
+
+
+def test_analyzer_not_ready_until_workers_loaded():
+    pytest.importorskip("spacy")
+    from src.ner_extractors import SpacyGeoAnalyzer
+
+    pool = _Pool(ready=False)
+    analyzer = SpacyGeoAnalyzer(model_path="/nonexistent", worker_pool=pool, lazy=True)
+    assert analyzer.ensure_loaded() is False
+    assert not analyzer.ready
+
+    pool.ready = True
+    assert analyzer.ensure_loaded() is True
+    assert analyzer.ready
+    analyzer.ensure_loaded()
+    assert pool.calls == 2
@@ -0,0 +1,73 @@
+from src.text_chunking import chunk_text, merge_chunk_entities
+
+
+def _spans(chunks):
+    return [(offset, offset + len(chunk)) for offset, chunk in chunks]
+
+
+def test_short_text_is_one_chunk():
+    assert chunk_text("De Veldstraat in Gent.", 2000, 200) == [(0, "De Veldstraat in Gent.")]
+    assert chunk_text("x" * 5000, 0) == [(0, "x" * 5000)]
+
+
+def test_chunks_are_bounded_and_cover_text():
+    text = "Zin een over de Veldstraat. " * 300
+    chunks = chunk_text(text, 2000, 200)
+    assert all(len(chunk) <= 2000 for _, chunk in chunks)
+    assert all(text[offset:offset + len(chunk)] == chunk for offset, chunk in chunks)
+    spans = _spans(chunks)
+    assert spans[0][0] == 0 and spans[-1][1] == len(text)
+    for (_, end), (start, _) in zip(spans, spans[1:]):
+        # Consecutive windows overlap by at most `overlap` characters, without gaps
+        assert end - 200 <= start <= end
+
+
+def test_chunks_end_on_sentence_boundaries():
+    text = "Zin een over de Veldstraat. " * 300
+    for _, chunk in chunk_text(text, 2000, 200)[:-1]:
+        assert chunk.endswith(". ")
+
+
+def test_progress_without_boundaries_after_overlap():
+    text = ("Zin een over de Veldstraat. " * 50 + "\n\n") * 3 + "X" * 5000
+    spans = _spans(chunk_text(text, 2000, 200))
+    ends = [end for _, end in spans]
+    assert ends == sorted(set(ends))
+    assert spans[-1][1] == len(text)
+    assert len(spans) <= 6
+
+
+def test_progress_with_short_segments():
+    text = "a; " * 2000
+    spans = _spans(chunk_text(text, 2000, 200))
+    ends = [end for _, end in spans]
+    assert ends == sorted(set(ends))
+    assert len(spans) == 4
+
+
+def test_hard_cut_without_whitespace():
+    assert _spans(chunk_text("X" * 4500, 2000, 200)) == [(0, 2000), (2000, 4000), (4000, 4500)]
+
+
+def test_merge_remaps_offsets():
+    merged = merge_chunk_entities([
+        (0, [{"text": "Veldstraat", "label": "STREET", "start": 4, "end": 14}]),
+        (100, [{"text": "Gent", "label": "CITY", "start": 10, "end": 14}]),
+    ])
+    assert [(e["label"], e["start"], e["end"]) for e in merged] == [("STREET", 4, 14), ("CITY", 110, 114)]
+
+
+def test_merge_keeps_longest_overlap_duplicate():
+    merged = merge_chunk_entities([
+        (0, [{"text": "Sint-Pieters", "label": "STREET", "start": 90, "end": 102}]),
+        (80, [{"text": "Sint-Pietersnieuwstraat", "label": "STREET", "start": 10, "end": 33}]),
+        (80, [{"text": "Sint-Pieters", "label": "CITY", "start": 10, "end": 22}]),
+    ])
+    assert [(e["label"], e["start"], e["end"]) for e in merged] == [("STREET", 90, 113), ("CITY", 90, 102)]
+
+
+def test_merge_drops_exact_duplicates_and_keeps_unpositioned_entities():
+    entity = {"text": "Gent", "label": "CITY", "start": 5, "end": 9}
+    title = {"text": "Titel", "label": "TITLE", "start": 0, "end": 0}
+    merged = merge_chunk_entities([(0, [entity, title]), (0, [dict(entity), dict(title)])])
+    assert merged == [title, entity]
@@ -68,7 +68,7 @@ try:
     
     # Create Geo annotation
     geo_ann = GeoAnnotation(
-        geojson={"type": "Polygon", "coordinates": [[3.72, 51.05], [3.73, 51.06]]},
+        geojson={"type": "Polygon", "coordinates": [[[3.72, 51.05], [3.73, 51.05], [3.73, 51.06], [3.72, 51.05]]]},
         activity_id="http://example.org/verify-test-geo",
         source_uri="http://example.org/verify-source-geo",
         class_uri="http://example.org/verify-location",
@@ -2,9 +2,11 @@ import os
 import json
 
 from src.airo import register_airo
-from src.task import Task
+from src.task import Task, GeoExtractionTask
+from src.model_warmup import start_warm_up, readiness
 
 from fastapi import APIRouter, BackgroundTasks
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Literal
 
@@ -12,6 +14,8 @@ from typing import Literal
 @app.on_event("startup")
 async def startup_event():
     register_airo()
+    # Load the NER models in the background so /delta and health checks respond right away
+    start_warm_up(GeoExtractionTask.ner_analyzer)
 
 
 router = APIRouter()
@@ -52,6 +56,13 @@ class NotificationResponse(BaseModel):
     message: str
 
 
+@router.get("/ready")
+async def ready() -> JSONResponse:
+    """Readiness probe: 200 once all warm-up models are loaded, 503 (with per-model state) before that."""
+    status = readiness()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
+
 @router.post("/delta", status_code=202)
 async def delta(data: list[DeltaNotification], background_tasks: BackgroundTasks) -> NotificationResponse:
     for patch in data: